@@ -0,0 +1,98 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaAdaptiveSampler.py                                                                            ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements error-driven candidate selection for adaptive dataset generation. Estimates the local ║
+# ║              error of a nearest-neighbour interpolant over the CEA outputs gathered so far and steers the     ║
+# ║              next round of CEA solves towards the regions of the input domain where the outputs change        ║
+# ║              fastest.                                                                                         ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import numpy             as np
+from   scipy.spatial     import cKDTree
+
+class CeaAdaptiveSampler:
+    neighbors = 8
+    exploration = 0.1
+
+    ## Constructor for a CeaAdaptiveSampler object, which ranks candidate operating points by how much a CEA solve
+    #  there is expected to add to the dataset. Each solved point is given a leave-one-out error: the distance 
+    #  between its (log-scaled, standardized) outputs and the mean outputs of its nearest neighbours in the 
+    #  sampler's unit cube. Candidates are scored by the mean error of their nearest solved neighbours times the
+    #  distance to the nearest of them, so steep regions are refined while already dense regions are left alone.
+    #
+    #  @param self        The reference to the calling CeaAdaptiveSampler object
+    #  @param neighbors   An optional parameter giving the number of nearest neighbours used by the error estimate
+    #  @param exploration An optional parameter giving the score floor, as a fraction of the mean candidate score,
+    #                     which keeps a share of each round spread over the rest of the domain
+    #
+    #  @returns           None (constructor)
+    def __init__(self, neighbors=8, exploration=0.1):
+        self.neighbors   = neighbors
+        self.exploration = exploration
+        self.tree        = None
+        self.error       = None
+
+    ## Builds the error estimate from the points solved so far.
+    #
+    #  @param self      The reference to the calling CeaAdaptiveSampler object
+    #  @param unit      An (n, 3) array of solved points in the sampler's unit cube
+    #  @param outputs   An (n, m) array of the CEA outputs at those points
+    #
+    #  @returns         None
+    def fit(self, unit, outputs):
+        if len(unit) < 2:
+            return
+        targets              = np.array(outputs, dtype=np.float64)
+        positive             = np.all(targets > 0.0, axis=0)
+        targets[:, positive] = np.log(targets[:, positive])
+        scale                = targets.std(axis=0)
+        targets              = (targets - targets.mean(axis=0)) / np.where(scale > 0.0, scale, 1.0)
+        self.tree            = cKDTree(unit)
+        (distance, index)    = self.tree.query(unit, k=min(self.neighbors, len(unit) - 1) + 1)
+        prediction           = targets[index[:, 1:]].mean(axis=1)
+        self.error           = np.abs(targets - prediction).mean(axis=1)
+
+    ## Scores candidate points by their expected benefit (see the constructor).
+    #
+    #  @param self      The reference to the calling CeaAdaptiveSampler object
+    #  @param unit      An (n, 3) array of candidate points in the sampler's unit cube
+    #
+    #  @returns         An array of n non-negative scores
+    def score(self, unit):
+        (distance, index) = self.tree.query(unit, k=min(self.neighbors, self.tree.n))
+        if distance.ndim == 1:
+            (distance, index) = (distance[:, np.newaxis], index[:, np.newaxis])
+        return self.error[index].mean(axis=1) * distance[:, 0]
+
+    ## Picks which candidates to solve next. Candidates are drawn without replacement with probability proportional
+    #  to their score (plus the exploration floor) rather than by rank, so that a round does not pile onto the 
+    #  single steepest spot. Before self.fit() has seen two solved points, candidates are picked uniformly.
+    #
+    #  @param self      The reference to the calling CeaAdaptiveSampler object
+    #  @param unit      An (n, 3) array of candidate points in the sampler's unit cube
+    #  @param count     The number of candidates to pick (at most n)
+    #  @param rng       The numpy.random.Generator used to draw the picks
+    #
+    #  @returns         A sorted array of 'count' candidate indexes
+    def select(self, unit, count, rng):
+        if self.tree is None:
+            return np.sort(rng.choice(len(unit), count, replace=False))
+        score  = self.score(unit)
+        weight = score + self.exploration * max(score.mean(), np.finfo(np.float64).tiny)
+        return np.sort(rng.choice(len(unit), count, replace=False, p=weight / weight.sum()))
@@ -0,0 +1,412 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaCampaign.py                                                                                   ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements checkpointed, resumable dataset generation campaigns over many fuel/oxidizer pairs.   ║
+# ║              Progress, row counts and random stream positions are recorded in a JSON manifest so that an      ║
+# ║              interrupted campaign can be restarted without losing or duplicating samples.                     ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import collections
+import itertools
+import json
+import multiprocessing     as mp
+import os
+import queue
+import tempfile
+import time
+import numpy               as np
+from   rocketcea           import cea_obj
+from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaFeasibilityMap   import CeaFeasibilityMap
+from   CeaDatasetSink      import CeaDatasetSink
+from   CeaTensorDataset    import CeaTensorDataset
+
+class CeaCampaign:
+    output_dir = ""
+    manifest = {}
+    backend = None
+    progress_interval = 10.0
+
+    ## Constructor for a CeaCampaign object. A campaign generates one dataset per fuel/oxidizer pair under 
+    #  'output_dir' and records its progress in 'output_dir/manifest.json'. If a manifest already exists there, the
+    #  campaign is resumed: the seed, sample size, checkpoint interval and generator options stored in the manifest 
+    #  take precedence over the arguments given here, and pairs not yet in the manifest are appended to it.
+    #
+    #  @param self            The reference to the calling CeaCampaign object
+    #  @param pairs           A list of (fuel, oxidizer) tuples to generate datasets for
+    #  @param output_dir      The directory holding the manifest and the per-pair dataset parts
+    #  @param n               An optional parameter giving the number of samples to generate per pair
+    #  @param checkpoint_rows An optional parameter giving the number of rows written between checkpoints. Rounded
+    #                         up to a multiple of CeaDatasetGenerator.chunk_size.
+    #  @param format          An optional parameter selecting 'parquet' or 'csv' part files
+    #  @param seed            An optional campaign seed from which every pair's seed is derived
+    #  @param backend         An optional CEA backend passed to each CeaDatasetGenerator (see its 'backend'). Not 
+    #                         recorded in the manifest, so it must be given again when resuming.
+    #  @param options         Additional keyword arguments passed to each CeaDatasetGenerator (e.g. p_min, p_max). 
+    #                         With feasibility=True, each pair's feasibility map is saved at every checkpoint and 
+    #                         reloaded on resume; checkpoint_rows must then be a whole number of feasibility waves.
+    #
+    #  @returns               None (constructor)
+    def __init__(self, pairs, output_dir, n=100_000, checkpoint_rows=10_000, format="parquet", seed=None, 
+                 backend=cea_obj.CEA_Obj, **options):
+        self.output_dir = output_dir
+        self.backend    = backend
+        chunk_size      = CeaDatasetGenerator.chunk_size
+        if os.path.exists(self._manifest_path()):
+            with open(self._manifest_path()) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = { "seed":            np.random.SeedSequence(seed).entropy,
+                              "n":               n,
+                              "checkpoint_rows": -(-checkpoint_rows // chunk_size) * chunk_size,
+                              "format":          format,
+                              "options":         options,
+                              "pairs":           {} }
+        wave = self.manifest["options"].get("feasibility_wave", 1)
+        if (self.manifest["checkpoint_rows"] // chunk_size) % wave != 0:
+            raise ValueError(f"checkpoint_rows ({self.manifest['checkpoint_rows']}) must be a multiple of "
+                             f"feasibility_wave ({wave}) chunks of {chunk_size} rows")
+        for (fuel, oxidizer) in pairs:
+            key = f"{fuel}_{oxidizer}"
+            if key not in self.manifest["pairs"]:
+                pair_seed = np.random.SeedSequence(self.manifest["seed"], 
+                                                   spawn_key=(len(self.manifest["pairs"]),)).generate_state(4)
+                self.manifest["pairs"][key] = { "fuel":       fuel,
+                                                "oxidizer":   oxidizer,
+                                                "seed":       [ int(word) for word in pair_seed ],
+                                                "status":     "pending",
+                                                "rows":       0,
+                                                "next_chunk": 0,
+                                                "parts":      [] }
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._save_manifest()
+
+    ## Runs (or resumes) the campaign. Completed pairs are skipped. Each remaining pair continues from the row count 
+    #  recorded in the manifest, which always sits on a chunk boundary, so its random stream picks up exactly where
+    #  the last checkpoint left off and no sample is generated twice. 
+    #
+    #  The chunks of every remaining pair are interleaved into one shared task queue, so that all workers stay busy
+    #  until the whole campaign is done rather than idling at the tail of each pair; each worker keeps one CEA_Obj 
+    #  per pair it has worked on. Chunks of a pair may finish out of order and are held back until all earlier 
+    #  chunks have arrived; after every 'checkpoint_rows' rows of a pair, in order, the batch is written to a new 
+    #  part file and the manifest is updated. The output is therefore identical to running the pairs one by one. 
+    #  Progress, throughput and an ETA are reported for a pair and for the campaign as its chunks complete (at most
+    #  once every 'progress_interval' seconds) and at each of its checkpoints.
+    #
+    #  If the generators use a feasibility map, each pair's chunks are queued one feasibility wave at a time (see 
+    #  CeaDatasetGenerator._run_chunks()): a wave's observations are merged into the pair's map, in chunk order, 
+    #  once all of its chunks are back, and only then is the next wave queued, screened against the updated map. 
+    #  Since checkpoints fall on wave boundaries, the map saved with each checkpoint is exactly the one the next 
+    #  wave is screened against, so a resumed campaign carries on as if it had never stopped.
+    #
+    #  A pair whose generator cannot be set up (e.g. a propellant RocketCEA does not know) is marked 'failed' in the
+    #  manifest, with the error, and left out of the run; the other pairs carry on. Failed pairs are retried on the
+    #  next run.
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #  @param workers   An optional parameter giving the number of worker processes shared by all pairs
+    #
+    #  @returns         None
+    def run(self, workers=1):
+        generators = {}
+        plans      = {}
+        waves      = {}
+        for (key, entry) in self.manifest["pairs"].items():
+            if entry["status"] == "complete":
+                print(f"{key}: complete ({entry['rows']} rows), skipping")
+                continue
+            try:
+                generator = CeaDatasetGenerator(entry["fuel"], entry["oxidizer"], n=self.manifest["n"], 
+                                                seed=entry["seed"], backend=self.backend, 
+                                                **self.manifest["options"])
+            except Exception as error:
+                entry["status"] = "failed"
+                entry["error"]  = str(error)
+                self._save_manifest()
+                print(f"{key}: failed ({error}), skipping")
+                continue
+            if entry.pop("error", None) is not None:
+                entry["status"] = "partial" if entry["rows"] > 0 else "pending"
+                self._save_manifest()
+            if (generator.feasibility is not None) and (entry.get("feasibility") is not None):
+                generator.feasibility = CeaFeasibilityMap.load(os.path.join(self.output_dir, entry["feasibility"]))
+            generators[key] = generator
+            plans[key]      = generator._chunk_plan(entry["rows"])
+            waves[key]      = generator._chunk_waves(plans[key])
+            os.makedirs(os.path.join(self.output_dir, key), exist_ok=True)
+        running  = { key: {} for key in plans }
+        tasks    = collections.deque(task for tasks in itertools.zip_longest(*[ self._queue_wave(key, generators[key], 
+                                                                                                  waves[key], 
+                                                                                                  running[key]) 
+                                                                               for key in plans ]) 
+                                          for task in tasks if task is not None)
+        pending  = { key: {} for key in plans }
+        buffers  = { key: [] for key in plans }
+        self._progress = { "start":     time.perf_counter(), 
+                           "reported":  time.perf_counter(), 
+                           "rows":      { key: 0 for key in plans }, 
+                           "remaining": { key: sum(size for (index, skip, size) in plan) 
+                                          for (key, plan) in plans.items() } }
+        for key in [ key for (key, plan) in plans.items() if len(plan) == 0 ]:
+            self._complete(key, generators[key])
+        count = sum(len(plan) for plan in plans.values())
+        for (key, index, values, chunk_observed, chunk_stats) in self._run_tasks(generators, tasks, count, workers):
+            generator = generators[key]
+            if chunk_stats is not None:
+                generator.stats.merge(chunk_stats)
+            running[key][index]               = chunk_observed
+            pending[key][index]               = values
+            self._progress["rows"][key]      += len(values)
+            self._progress["remaining"][key] -= len(values)
+            self._report_progress(key, self.progress_interval)
+            if (generator.feasibility is not None) and all(observed is not None for observed in running[key].values()):
+                for chunk in sorted(running[key]):
+                    generator.feasibility.merge(running[key][chunk])
+                running[key].clear()
+                tasks.extend(self._queue_wave(key, generator, waves[key], running[key]))
+            while (len(plans[key]) > 0) and (plans[key][0][0] in pending[key]):
+                buffers[key].append(pending[key].pop(plans[key].pop(0)[0]))
+                rows = sum(len(values) for values in buffers[key])
+                if (rows >= self.manifest["checkpoint_rows"]) or (len(plans[key]) == 0):
+                    buffered     = np.concatenate(buffers[key])
+                    buffers[key] = []
+                    for start in range(0, len(buffered), self.manifest["checkpoint_rows"]):
+                        batch = buffered[start:(start + self.manifest["checkpoint_rows"])]
+                        if (len(batch) < self.manifest["checkpoint_rows"]) and (len(plans[key]) > 0):
+                            buffers[key].append(batch)
+                        else:
+                            self._checkpoint(key, self.manifest["pairs"][key], generator._build_frame(batch), 
+                                             generator.feasibility)
+            if len(plans[key]) == 0:
+                self._complete(key, generator)
+
+    ## Takes the next wave of chunks of a pair off its list of waves and returns the corresponding campaign tasks. 
+    #  Each task carries a copy of the pair's feasibility map as it stands (None if no map is in use), and the 
+    #  chunks of the wave are entered in 'running' to await their results.
+    #
+    #  @param self       The reference to the calling CeaCampaign object
+    #  @param key        The manifest key of the pair
+    #  @param generator  The CeaDatasetGenerator of the pair
+    #  @param waves      The remaining waves of the pair, from CeaDatasetGenerator._chunk_waves()
+    #  @param running    A dictionary of the pair's chunks in progress, mapping chunk indexes to their feasibility 
+    #                    observations (None until the chunk is done)
+    #
+    #  @returns          A list of (manifest key, chunk index, rows to skip, rows to keep, feasibility map) tuples
+    def _queue_wave(self, key, generator, waves, running):
+        if len(waves) == 0:
+            return []
+        feasibility = None if generator.feasibility is None else generator.feasibility.copy()
+        wave        = waves.pop(0)
+        running.update({ index: None for (index, skip, size) in wave })
+        return [ (key,) + chunk + (feasibility,) for chunk in wave ]
+
+    ## Runs campaign tasks in-process (workers=1) or across one process pool shared by all pairs, yielding results
+    #  in completion order. Tasks are taken from the left of the 'tasks' queue, which the caller may extend 
+    #  between results (e.g. with the next wave of a pair).
+    #
+    #  @param self       The reference to the calling CeaCampaign object
+    #  @param generators A dictionary mapping manifest keys to the CeaDatasetGenerator of each pair
+    #  @param tasks      A collections.deque of (manifest key, chunk index, rows to skip, rows to keep, feasibility
+    #                    map) tuples
+    #  @param count      The total number of tasks that will be run, used to size the process pool
+    #  @param workers    The number of worker processes to use
+    #
+    #  @returns          A generator of (manifest key, chunk index, values, feasibility observations, stats) tuples
+    def _run_tasks(self, generators, tasks, count, workers=1):
+        if (workers is None) or (workers <= 1) or (count <= 1):
+            while len(tasks) > 0:
+                (key, index, skip, size, feasibility) = tasks.popleft()
+                yield (key, index) + generators[key]._call_task("_sample_chunk", (index, skip, size, feasibility))
+        else:
+            results = queue.SimpleQueue()
+            with tempfile.TemporaryDirectory(prefix="rocketcea-") as data_dir, \
+                 mp.Pool(processes=min(workers, count), initializer=_init_campaign_worker, 
+                         initargs=(generators, data_dir)) as pool:
+                submitted = 0
+                while len(tasks) > 0 or submitted > 0:
+                    while len(tasks) > 0:
+                        pool.apply_async(_campaign_worker_chunk, (tasks.popleft(),), callback=results.put, 
+                                         error_callback=results.put)
+                        submitted += 1
+                    result     = results.get()
+                    submitted -= 1
+                    if isinstance(result, BaseException):
+                        raise result
+                    yield result
+
+    ## Marks a pair as complete in the manifest and reports on it. If the generator carries instrumentation (the 
+    #  'stats' generator option), the stats record of the run is also saved as 'stats.json' next to the pair's part
+    #  files.
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #  @param key       The manifest key of the pair
+    #  @param generator The CeaDatasetGenerator of the pair
+    #
+    #  @returns         None
+    def _complete(self, key, generator):
+        entry           = self.manifest["pairs"][key]
+        entry["status"] = "complete"
+        self._save_manifest()
+        print(f"{key}: complete ({entry['rows']} rows)")
+        if generator.feasibility is not None:
+            report = generator.feasibility.report()
+            print(f"{key}: {report['rejection_rate']:.1%} of CEA solves rejected, {report['screened']} candidates "
+                  f"screened out (~{report['cea_time_saved']:.1f} s of CEA time saved)")
+        if generator.stats is not None:
+            generator.stats.save(os.path.join(self.output_dir, key, "stats.json"))
+            record = generator.stats.record()
+            print(f"{key}: {record['cea_calls_per_row']:.2f} CEA calls per row; time by phase: " + 
+                  ", ".join(f"{phase} {seconds:.1f} s" for (phase, seconds) in record["phases"].items()))
+
+    ## Exports the dataset of every complete pair to training tensors under 'output_dir/<pair>/tensors', streaming
+    #  from its part files (see CeaTensorDataset.export()).
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #  @param dtype     An optional parameter selecting 'float32' or 'float16' tensors
+    #  @param format    An optional parameter selecting '.npy' files ('npy') or raw memory maps ('raw')
+    #
+    #  @returns         None
+    def export_tensors(self, dtype="float32", format="npy"):
+        for (key, entry) in self.manifest["pairs"].items():
+            if entry["status"] != "complete":
+                print(f"{key}: {entry['status']}, not exported")
+                continue
+            parts   = [ os.path.join(self.output_dir, part) for part in entry["parts"] ]
+            dataset = CeaTensorDataset.export(parts, os.path.join(self.output_dir, key, "tensors"), dtype, format)
+            print(f"{key}: exported {dataset.metadata['rows']} rows of {dtype} tensors "
+                  f"({(dataset.inputs.nbytes + dataset.targets.nbytes) / 2**20:.1f} MiB)")
+
+    ## Writes one batch to the next part file of a pair and records it in the manifest, along with the pair's 
+    #  feasibility map, if any, as it stands after the batch. The part and map are written under temporary names and
+    #  renamed into place, and the manifest is only updated afterwards (the map file being named after the part, 
+    #  the previous one is removed once the manifest no longer refers to it), so an interruption at any point leaves
+    #  the manifest describing complete part files and the matching map only.
+    #
+    #  @param self        The reference to the calling CeaCampaign object
+    #  @param key         The manifest key of the pair
+    #  @param entry       The manifest entry of the pair
+    #  @param batch       The DataFrame batch to write
+    #  @param feasibility An optional CeaFeasibilityMap of the pair to save with the batch
+    #
+    #  @returns           None
+    def _checkpoint(self, key, entry, batch, feasibility=None):
+        part      = os.path.join(key, f"part-{len(entry['parts']):05d}.{self.manifest['format']}")
+        part_path = os.path.join(self.output_dir, part)
+        with CeaDatasetSink(part_path + ".tmp", format=self.manifest["format"]) as sink:
+            sink.write(batch)
+        os.replace(part_path + ".tmp", part_path)
+        previous = entry.get("feasibility")
+        if feasibility is not None:
+            entry["feasibility"] = os.path.join(key, f"feasibility-{len(entry['parts']):05d}.npz")
+            with open(os.path.join(self.output_dir, entry["feasibility"]) + ".tmp", "wb") as f:
+                feasibility.save(f)
+            os.replace(os.path.join(self.output_dir, entry["feasibility"]) + ".tmp", 
+                       os.path.join(self.output_dir, entry["feasibility"]))
+        entry["parts"].append(part)
+        entry["rows"]      += len(batch.index)
+        entry["next_chunk"] = entry["rows"] // CeaDatasetGenerator.chunk_size
+        entry["status"]     = "partial"
+        self._save_manifest()
+        if (previous is not None) and (previous != entry.get("feasibility")):
+            os.remove(os.path.join(self.output_dir, previous))
+        print(f"{key}: checkpoint {len(entry['parts'])} ({entry['rows']}/{self.manifest['n']} rows)")
+        self._report_progress(key)
+
+    ## Prints the throughput and estimated time to completion of a pair and of the whole campaign, based on the 
+    #  rows generated since self.run() started. Pairs share the worker pool, so a pair's rate is its share of the 
+    #  campaign throughput rather than what it would achieve alone.
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #  @param key       The manifest key of the pair
+    #  @param interval  An optional parameter giving the minimum number of seconds since the previous report; if 
+    #                   less time has passed, nothing is printed
+    #
+    #  @returns         None
+    def _report_progress(self, key, interval=0.0):
+        progress  = getattr(self, "_progress", None)
+        now       = time.perf_counter()
+        if (progress is None) or (now - progress["reported"] < interval):
+            return
+        progress["reported"] = now
+        elapsed   = now - progress["start"]
+        rows      = sum(progress["rows"].values())
+        remaining = sum(progress["remaining"].values())
+        pair_rate = progress["rows"][key] / elapsed
+        rate      = rows / elapsed
+        print(f"{key}: {pair_rate:.0f} rows/s, ETA {_format_duration(progress['remaining'][key] / pair_rate)}; "
+              f"campaign: {rows}/{rows + remaining} rows this run, {rate:.0f} rows/s, "
+              f"ETA {_format_duration(remaining / rate)}")
+
+    ## Atomically rewrites the campaign manifest.
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #
+    #  @returns         None
+    def _save_manifest(self):
+        with open(self._manifest_path() + ".tmp", "w") as f:
+            json.dump(self.manifest, f, indent=4)
+        os.replace(self._manifest_path() + ".tmp", self._manifest_path())
+
+    ## Returns the path of the campaign manifest.
+    #
+    #  @param self      The reference to the calling CeaCampaign object
+    #
+    #  @returns         The path of 'manifest.json' under self.output_dir
+    def _manifest_path(self):
+        return os.path.join(self.output_dir, "manifest.json")
+
+## Formats a duration in seconds as hours, minutes and seconds.
+#
+#  @param seconds   The duration, in seconds
+#
+#  @returns         A string such as '1h02m03s'
+def _format_duration(seconds):
+    (minutes, seconds) = divmod(int(round(seconds)), 60)
+    (hours, minutes)   = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s"
+
+_worker_generators = None
+
+## Process pool initializer. Installs private copies of the generators of every pair in each worker process. Each
+#  worker builds the CEA_Obj of a pair the first time it receives one of its chunks, and keeps it for the rest of 
+#  the campaign; any CEA_Obj inherited from the parent process (which is bound to the parent's data directory when
+#  the pool forks) is discarded. As in CeaDatasetGenerator, each worker uses its own RocketCEA data directory.
+#
+#  @param generators A dictionary mapping manifest keys to the CeaDatasetGenerator of each pair
+#  @param data_dir   A scratch directory under which the worker creates its private RocketCEA data directory
+#
+#  @returns          None
+def _init_campaign_worker(generators, data_dir):
+    global _worker_generators
+    cea_obj.ROCKETCEA_DATA_DIR = tempfile.mkdtemp(dir=data_dir)
+    _worker_generators         = generators
+    for generator in _worker_generators.values():
+        generator.cea = None
+
+## Process pool task. Computes one chunk of one pair using the worker's private generator for that pair.
+#
+#  @param task      A (manifest key, chunk index, rows to skip, rows to keep, feasibility map) tuple
+#
+#  @returns         A (manifest key, chunk index, values, feasibility observations, stats) tuple
+def _campaign_worker_chunk(task):
+    (key, index, skip, size, feasibility) = task
+    generator = _worker_generators[key]
+    if generator.cea is None:
+        generator.cea = generator.backend(oxName=generator.oxidizer, fuelName=generator.fuel)
+    return (key, index) + generator._call_task("_sample_chunk", (index, skip, size, feasibility))
@@ -0,0 +1,106 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaCampaignTest.py                                                                               ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Offline test that a CeaCampaign interrupted after a checkpoint and resumed writes the same part  ║
+# ║              files and manifest as an uninterrupted campaign, using the CeaReplayBackend in place of CEA.     ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import glob
+import json
+import os
+import tempfile
+import numpy               as np
+import pandas              as pd
+from   CeaCampaign         import CeaCampaign
+from   CeaFeasibilityMap   import CeaFeasibilityMap
+from   CeaReplayBackend    import CeaReplayBackend
+
+## Raised by the patched checkpoint below to simulate the campaign being killed.
+class Interrupted(Exception):
+    pass
+
+## Runs a campaign over two pairs into 'output_dir' with the replay backend in place of CEA.
+#
+#  @param output_dir The campaign directory
+#  @param options    Additional CeaDatasetGenerator options
+#
+#  @returns          The CeaCampaign object
+def make_campaign(output_dir, options):
+    return CeaCampaign([ ("CH4", "LOX"), ("RP-1", "LOX") ], output_dir, n=3500, checkpoint_rows=1000, seed=11, 
+                       backend=CeaReplayBackend, **options)
+
+## Reads the manifest, the part files and the feasibility maps of a campaign directory.
+#
+#  @param output_dir The campaign directory
+#
+#  @returns          A (manifest pairs, { part file: DataFrame }, { pair: CeaFeasibilityMap }) tuple
+def read_campaign(output_dir):
+    with open(os.path.join(output_dir, "manifest.json")) as f:
+        pairs = json.load(f)["pairs"]
+    parts = { os.path.relpath(path, output_dir): pd.read_parquet(path) 
+              for path in sorted(glob.glob(os.path.join(output_dir, "*", "part-*"))) }
+    maps  = { key: CeaFeasibilityMap.load(os.path.join(output_dir, entry["feasibility"])) 
+              for (key, entry) in pairs.items() if "feasibility" in entry }
+    return (pairs, parts, maps)
+
+# Run the campaign once without interruption, and once interrupted right after its third checkpoint and resumed by 
+# a fresh CeaCampaign (as re-running dataset_generator.py would) with a different worker count. The resumed 
+# campaign must produce exactly the same part files and manifest as the uninterrupted one; with a feasibility map,
+# each pair's map is saved at every checkpoint and must also end up the same.
+if __name__ == "__main__":
+    for options in [ {}, { "feasibility": True } ]:
+        with tempfile.TemporaryDirectory() as reference_dir, tempfile.TemporaryDirectory() as resumed_dir:
+            make_campaign(reference_dir, options).run(workers=2)
+
+            campaign   = make_campaign(resumed_dir, options)
+            checkpoint = campaign._checkpoint
+            written    = []
+            def interrupting_checkpoint(key, *arguments):
+                checkpoint(key, *arguments)
+                written.append(key)
+                if len(written) == 3:
+                    raise Interrupted()
+            campaign._checkpoint = interrupting_checkpoint
+            try:
+                campaign.run(workers=2)
+                raise AssertionError("the campaign was not interrupted")
+            except Interrupted:
+                (pairs, parts, maps) = read_campaign(resumed_dir)
+                assert all(entry["status"] != "complete" for entry in pairs.values()), "a pair completed early"
+                assert len(parts) == 3, f"expected 3 part files after the interruption, found {len(parts)}"
+                assert not glob.glob(os.path.join(resumed_dir, "*", "*.tmp")), "a temporary file was left behind"
+                assert len(maps) == (2 if options else 0), f"expected a feasibility map per pair, found {len(maps)}"
+                print(f"{options}: interrupted after {len(parts)} checkpoints: " + 
+                      ", ".join(f"{key} {entry['rows']} rows" for (key, entry) in pairs.items()))
+
+            make_campaign(resumed_dir, options).run(workers=1)
+            (reference_pairs, reference_parts, reference_maps) = read_campaign(reference_dir)
+            (resumed_pairs, resumed_parts, resumed_maps)       = read_campaign(resumed_dir)
+            assert resumed_pairs == reference_pairs, "the resumed manifest differs from the uninterrupted one"
+            assert list(resumed_parts) == list(reference_parts), "the resumed part files differ"
+            for (part, data) in reference_parts.items():
+                pd.testing.assert_frame_equal(resumed_parts[part], data)
+            for (key, feasibility) in reference_maps.items():
+                assert np.array_equal(resumed_maps[key].accepted, feasibility.accepted) and \
+                       np.array_equal(resumed_maps[key].rejected, feasibility.rejected), f"{key}: the maps differ"
+                assert feasibility.report()["solved"] > 3500, f"{key}: the map is missing observations"
+            assert len(glob.glob(os.path.join(resumed_dir, "*", "feasibility-*"))) == len(resumed_maps), \
+                   "superseded feasibility maps were left behind"
+            print(f"{options}: resumed campaign: all {len(reference_parts)} part files match the uninterrupted "
+                  f"campaign")
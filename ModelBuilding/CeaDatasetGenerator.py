@@ -4,9 +4,11 @@
 # ║ Project:     Ariadne/ModelBuilding                                                                            ║
 # ║ Author:      Elijah Creed Fedele                                                                              ║
 # ║ Date:        January 10, 2023                                                                                 ║
-# ║ Description: Implements random (uniform) data input domain generation via Monte Carlo method and populates    ║
-# ║              that data using the RocketCEA Python wrapper to the NASA Chemical Equilibrium with Applications  ║
-# ║              combustion code.                                                                                 ║
+# ║ Description: Implements data input domain generation (Monte Carlo, Sobol, Halton or Latin hypercube sampling, ║
+# ║              optionally screened by a feasibility map, streamed in batches or refined adaptively where the    ║
+# ║              outputs change fastest) and populates that data using the RocketCEA Python wrapper to the NASA   ║
+# ║              Chemical Equilibrium with Applications combustion code, solving several area ratios per CEA run  ║
+# ║              if requested.                                                                                    ║
 # ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
 # ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
 # ║                                                                                                               ║
@@ -22,15 +24,54 @@
 # ║ <http://www.gnu.org/licenses/>.                                                                               ║
 # ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
 
+import contextlib
+import itertools
+import math
+import multiprocessing   as     mp
 import re
+import tempfile
+import time
 import numpy             as     np
 import pandas            as     pd
+from   rocketcea         import cea_obj
 from   rocketcea.cea_obj import CEA_Obj
+from   CeaAdaptiveSampler import CeaAdaptiveSampler
+from   CeaFeasibilityMap import CeaFeasibilityMap
+from   CeaGeneratorStats import CeaGeneratorStats
+from   CeaResultCache    import CeaResultCache
+from   CeaSampler        import CeaSampler
+
+# Precompiled patterns for scanning CEA full output strings. _CEA_ROW_REGEXP picks out, in a single pass, every 
+# station-property row consumed by CeaDatasetGenerator.parse_cea_output() and parse_cea_exits() along with the 
+# headers separating the equilibrium and frozen transport property blocks, as (label, values) pairs; every row 
+# starts with a newline and a space, which the regular expression engine can search for as a literal prefix. CEA 
+# prints these rows as a 16-column label followed by one 9-column field per station; _CEA_FIELD_REGEXP splits rows
+# into those fields, separating the 7-column mantissa and 2-column exponent of the notation CEA uses in the narrow
+# fields (e.g. ' 1.9750-2' or ' 3.6311 0') from blank fields and plain numbers.
+_EXIT_REGEXP        = re.compile(r"EXIT")
+_NAN_REGEXP         = re.compile(r"NaN")
+_PRESSURE_REGEXP    = re.compile(r"P, BAR\s*\d+.\d+\s*(\d+.\d+)\s*(\d+.\d+)")
+_MOLAR_MASS_REGEXP  = re.compile(r"M, \(1/n\)\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)")
+_ADIABAT_REGEXP     = re.compile(r"GAMMAs\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)")
+_TEMPERATURE_REGEXP = re.compile(r"T, K\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)")
+_CEA_ROW_REGEXP     = re.compile(r"\n (?=(P, BAR|T, K|RHO, KG/CU M|M, \(1/n\)|Cp, KJ/\(KG\)\(K\)|GAMMAs|"
+                                 r"MACH NUMBER|VISC,MILLIPOISE|CONDUCTIVITY|PRANDTL NUMBER|Ae/At|"
+                                 r" WITH EQUILIBRIUM REACTIONS| WITH FROZEN REACTIONS))[^\n]{0,15}([^\n]*)")
+_CEA_FIELD_REGEXP   = re.compile(r"(.{6}\d)([ +-]\d)| {9}|(.{1,9})")
 
 class CeaDatasetGenerator:
     fuel = ""
     oxidizer = ""
     elements = 0
+    chunk_size = 1000
+    max_eps_per_solve = 8
+    columns = [ "fuel", "oxidizer", "pressure", "mixture", "area_ratio", "pressure_throat", "pressure_exit", 
+                "molar_mass_chamber", "molar_mass_throat", "molar_mass_exit", "adiabat_chamber", "adiabat_throat", 
+                "adiabat_exit", "temperature_chamber", "temperature_throat", "temperature_exit", "rho_chamber", 
+                "rho_throat", "rho_exit", "spec_heat_chamber", "spec_heat_throat", "spec_heat_exit", "visc_chamber", 
+                "visc_throat", "visc_exit", "cond_chamber", "cond_throat", "cond_exit", "prandtl_chamber", 
+                "prandtl_throat", "prandtl_exit", "mach_exit" ]
+    numeric_columns = columns[2:]
 
     ## Constructor for a CeaDatasetGenerator object. Stores user selections for future invocation (i.e. when 
     #  self.get_cea_data() is called) and prepares data domain information for use in Monte Carlo generation.
@@ -45,80 +86,600 @@ class CeaDatasetGenerator:
     #  @param eps_min   An optional parameter which specifies the lower limit of nozzle expansion area ratio
     #  @param eps_max   An optional parameter which specifies the upper limit of nozzle expansion area ratio
     #  @param n         An optional parameter indicating the desired sample size.
+    #  @param seed      An optional seed (integer or sequence of integers) for the Monte Carlo sampling. A fresh
+    #                   seed is drawn from system entropy when none is given; it is kept in self.seed either way.
+    #  @param cache     An optional CeaResultCache, or the path of one, consulted before every CEA solve. Sampled
+    #                   operating points are rounded to the cache resolution (the precision of the CEA input deck).
+    #  @param sampler   An optional parameter naming the CeaSampler design used to draw operating points: 'uniform' 
+    #                   (Monte Carlo, the default), 'sobol', 'halton' or 'lhs'
+    #  @param log_axes  An optional list of the axes ('pressure', 'mixture', 'area_ratio') to sample in log space
+    #  @param feasibility An optional CeaFeasibilityMap (or True for a fresh one) used to screen out candidates 
+    #                     CEA is likely to reject. The map learns from every solve; see self.feasibility.report()
+    #                     and self._run_chunks().
+    #  @param feasibility_wave An optional parameter giving the number of consecutive chunks screened against the same
+    #                     state of the feasibility map, which is also the most chunks that can run in parallel while
+    #                     a map is in use (see self._run_chunks()). With the default of 1, every chunk is screened 
+    #                     against everything learned from the chunks before it.
+    #  @param eps_per_solve An optional parameter giving the number of area ratios (1 to 8) evaluated per CEA run.
+    #                     Above 1, each sampled (pressure, mixture) pair is shared by that many area ratios, whose 
+    #                     exit stations are all computed by one CEA invocation; the chamber and throat columns are 
+    #                     shared between the resulting rows. Area ratios are then rounded to the 6 significant 
+    #                     digits RocketCEA writes for a list of area ratios. Only applies to the sampled datasets of
+    #                     self.get_cea_data() and self.iter_batches(): the points chosen by 
+    #                     self.get_adaptive_cea_data() each have their own (pressure, mixture) pair, so they are 
+    #                     solved one per CEA run whatever this setting.
+    #  @param stats       An optional CeaGeneratorStats (or True for a fresh one) recording per-phase timings, 
+    #                     sample counters and throughput. Without one, instrumentation is skipped.
+    #  @param backend     An optional factory for the CEA backend, called as backend(oxName=..., fuelName=...) in
+    #                     each process; the result must provide CEA_Obj.get_full_cea_output(). Defaults to CEA_Obj 
+    #                     (see CeaReplayBackend for an offline stand-in).
     #
     #  @returns         None (constructor)
     def __init__(self, fuel, oxidizer, p_min=2.5, p_max=750.0, phi_min=0.01, phi_max=50.0, eps_min=1.0, 
-                 eps_max=200.0, n=10000):
-        self.fuel       = fuel
-        self.oxidizer   = oxidizer
-        self.elements   = n
-        self.p_range    = [ p_min, p_max ]
-        self.phi_range  = [ phi_min, phi_max ]
-        self.eps_range  = [ eps_min, eps_max ]
-        self.cea        = CEA_Obj(oxName=self.oxidizer, fuelName=self.fuel)
-        col_names       = [ "fuel", "oxidizer", "pressure", "mixture", "area_ratio", "pressure_throat", 
-                            "pressure_exit", "molar_mass_chamber", "molar_mass_throat", "molar_mass_exit", 
-                            "adiabat_chamber", "adiabat_throat", "adiabat_exit", "temperature_chamber", 
-                            "temperature_throat", "temperature_exit", "rho_chamber", "rho_throat", "rho_exit", 
-                            "spec_heat_chamber", "spec_heat_throat", "spec_heat_exit", "visc_chamber", 
-                            "visc_throat", "visc_exit", "cond_chamber", "cond_throat", "cond_exit", 
-                            "prandtl_chamber", "prandtl_throat", "prandtl_exit", "mach_exit" ]
-        self.data       = pd.DataFrame(columns=col_names)
-
-    ## Fills out the self.data DataFrame to a size of self.elements with CEA data.
+                 eps_max=200.0, n=10000, seed=None, cache=None, sampler="uniform", log_axes=(), feasibility=None,
+                 feasibility_wave=1, eps_per_solve=1, stats=None, backend=CEA_Obj):
+        if feasibility_wave < 1:
+            raise ValueError(f"feasibility_wave must be at least 1, got {feasibility_wave}")
+        if not (1 <= eps_per_solve <= self.max_eps_per_solve):
+            raise ValueError(f"eps_per_solve must be between 1 and {self.max_eps_per_solve} (CEA prints at most "
+                             f"{self.max_eps_per_solve} exit stations), got {eps_per_solve}")
+        self.fuel             = fuel
+        self.oxidizer         = oxidizer
+        self.elements         = n
+        self.p_range          = [ p_min, p_max ]
+        self.phi_range        = [ phi_min, phi_max ]
+        self.eps_range        = [ eps_min, eps_max ]
+        self.seed             = np.random.SeedSequence(seed).entropy
+        self.cache            = CeaResultCache(cache) if isinstance(cache, str) else cache
+        self.sampler          = sampler
+        self.log_axes         = list(log_axes)
+        self.feasibility      = CeaFeasibilityMap() if feasibility is True else feasibility
+        self.feasibility_wave = feasibility_wave
+        self.eps_per_solve    = eps_per_solve
+        self.stats            = CeaGeneratorStats() if stats is True else stats
+        self.backend          = backend
+        self.cea              = self.backend(oxName=self.oxidizer, fuelName=self.fuel)
+        self.data             = self._build_frame(np.empty((0, len(self.numeric_columns))))
+
+    ## Fills out the self.data DataFrame to a size of self.elements with CEA data. Samples are drawn in fixed-size
+    #  chunks of self.chunk_size rows, each with its own random stream derived from self.seed, and the chunks are 
+    #  reassembled in chunk order. The resulting dataset therefore depends only on the seed and sample size, not on
+    #  the number of worker processes used to compute it. Chunks are copied into one preallocated float64 array and 
+    #  the DataFrame is built once at the end, rather than growing it row by row.
     #
     #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param workers   An optional parameter giving the number of worker processes to spread the chunks across. 
+    #                   Each worker constructs its own CEA_Obj, as the CEA Fortran backend is not re-entrant.
     #
     #  @returns         The DataFrame constructed (self.data)
-    def get_cea_data(self):
-        while len(self.data.index) < self.elements:
-            pressure   = np.random.default_rng().uniform(low=self.p_range[0],   high=self.p_range[1])
-            mixture    = np.random.default_rng().uniform(low=self.phi_range[0], high=self.phi_range[1])
-            area_ratio = np.random.default_rng().uniform(low=self.eps_range[0], high=self.eps_range[1])
-            cea_fostr  = self.cea.get_full_cea_output(Pc=pressure, 
-                                                      MR=mixture, 
-                                                      eps=area_ratio, 
-                                                      short_output=1, 
-                                                      show_transport=1,
-                                                      output='siunits',
-                                                      pc_units='bar')
-            if self.is_valid_cea_result(cea_fostr):
-                (pressure_throat, pressure_exit) = self.get_pressures(cea_fostr)
-                (molar_mass_chamber, molar_mass_throat, molar_mass_exit) = self.get_molar_masses(cea_fostr)
-                (adiabat_chamber, adiabat_throat, adiabat_exit) = self.get_adiabat(cea_fostr)
-                (temperature_chamber, temperature_throat, temperature_exit) = self.get_temperatures(cea_fostr)
-                (rho_chamber, rho_throat, rho_exit) = self.cea.get_Densities(
-                                                          Pc=(pressure * 14.5038),
-                                                          MR=mixture,
-                                                          eps=area_ratio 
-                                                      )
-                mach_exit = self.cea.get_MachNumber(Pc=(pressure * 14.5038), MR=mixture, eps=area_ratio)
-                (spec_heat_chamber, visc_chamber, cond_chamber, prandtl_chamber) = self.cea.get_Chamber_Transport(
-                                                                                       Pc=(pressure * 14.5038),
-                                                                                       MR=mixture,
-                                                                                       eps=area_ratio 
-                                                                                   )
-                (spec_heat_throat, visc_throat, cond_throat, prandtl_throat) = self.cea.get_Throat_Transport(
-                                                                                   Pc=(pressure * 14.5038),
-                                                                                   MR=mixture,
-                                                                                   eps=area_ratio 
-                                                                               )
-                (spec_heat_exit, visc_exit, cond_exit, prandtl_exit) = self.cea.get_Exit_Transport(
-                                                                           Pc=(pressure * 14.5038),
-                                                                           MR=mixture,
-                                                                           eps=area_ratio 
-                                                                       )
-                self.data.loc[len(self.data.index)] = [ self.fuel, self.oxidizer, pressure, mixture, area_ratio,
-                                                        pressure_throat, pressure_exit, molar_mass_chamber, 
-                                                        molar_mass_throat, molar_mass_exit, adiabat_chamber, 
-                                                        adiabat_throat, adiabat_exit, temperature_chamber, 
-                                                        temperature_throat, temperature_exit, rho_chamber, 
-                                                        rho_throat, rho_exit, spec_heat_chamber, spec_heat_throat, 
-                                                        spec_heat_exit, visc_chamber, visc_throat, visc_exit, 
-                                                        cond_chamber, cond_throat, cond_exit, prandtl_chamber, 
-                                                        prandtl_throat, prandtl_exit, mach_exit ]
+    def get_cea_data(self, workers=1):
+        plan   = self._chunk_plan(len(self.data.index))
+        values = np.empty((sum(size for (index, skip, size) in plan), len(self.numeric_columns)), dtype=np.float64)
+        row    = 0
+        for chunk in self._iter_chunks(plan, workers):
+            values[row:(row + len(chunk))] = chunk
+            row += len(chunk)
+        if len(self.data.index) == 0:
+            self.data = self._build_frame(values)
+        else:
+            self.data = pd.concat([ self.data, self._build_frame(values) ], ignore_index=True)
         return self.data
 
+    ## Generates the dataset as a stream of fixed-size DataFrame batches without accumulating it in self.data, so 
+    #  memory use stays flat regardless of self.elements. Batches are cut from the same chunk sequence used by 
+    #  self.get_cea_data(), so for a given seed the concatenated batches equal the full dataset whatever the batch
+    #  size or worker count.
+    #
+    #  @param self       The reference to the calling CeaDatasetGenerator object
+    #  @param batch_size The number of rows in each batch (the final batch may be shorter)
+    #  @param workers    An optional parameter giving the number of worker processes to use
+    #  @param start      An optional parameter giving the first row of the dataset to generate. Used to resume an
+    #                    interrupted run; the rows produced are exactly those a full run would produce from 'start'.
+    #                    With a feasibility map, this only holds if self.feasibility is the map a full run would 
+    #                    have learned by then (e.g. one saved when the interrupted run reached row 'start', as 
+    #                    CeaCampaign does at its checkpoints), since chunks are screened against the map as it stands.
+    #
+    #  @returns          A generator of DataFrames with the same column schema and dtypes as self.data
+    def iter_batches(self, batch_size, workers=1, start=0):
+        buffer = np.empty((batch_size, len(self.numeric_columns)), dtype=np.float64)
+        fill   = 0
+        for chunk in self._iter_chunks(self._chunk_plan(start), workers):
+            offset = 0
+            while offset < len(chunk):
+                take                        = min(batch_size - fill, len(chunk) - offset)
+                buffer[fill:(fill + take)]  = chunk[offset:(offset + take)]
+                fill                       += take
+                offset                     += take
+                if fill == batch_size:
+                    yield self._build_frame(buffer)
+                    buffer = np.empty((batch_size, len(self.numeric_columns)), dtype=np.float64)
+                    fill   = 0
+        if fill > 0:
+            yield self._build_frame(buffer[0:fill])
+
+    ## Generates self.elements rows adaptively, in rounds, and appends them to self.data. The first round spreads 
+    #  its share of the budget over the domain with the configured sampler; every later round draws a pool of 
+    #  'candidates' times as many points from the sampler and solves the subset that a CeaAdaptiveSampler, fitted on
+    #  the rows gathered so far, expects to be most informative. This concentrates CEA solves where the outputs
+    #  change fastest (e.g. near stoichiometric mixture ratios and at low chamber pressure). Each round gets an 
+    #  equal share of the rows still needed; rejected solves are made up by further rounds if necessary. Points are
+    #  solved one per CEA run, since the selected points do not share (pressure, mixture) pairs; 'eps_per_solve' is 
+    #  not used here.
+    #
+    #  @param self       The reference to the calling CeaDatasetGenerator object
+    #  @param rounds     An optional parameter giving the number of rounds to split the budget over
+    #  @param candidates An optional parameter giving the size of each round's candidate pool, as a multiple of its
+    #                    budget
+    #  @param columns    An optional list of output column names driving the error estimate (all output columns 
+    #                    by default)
+    #  @param workers    An optional parameter giving the number of worker processes to use
+    #
+    #  @returns          The DataFrame self.data, extended with the new rows
+    def get_adaptive_cea_data(self, rounds=4, candidates=8, columns=None, workers=1):
+        sampler  = self._make_sampler()
+        refiner  = CeaAdaptiveSampler()
+        outputs  = [ self.numeric_columns.index(column) for column in (columns or self.numeric_columns[3:]) ]
+        values   = np.empty((0, len(self.numeric_columns)), dtype=np.float64)
+        step     = 0
+        while len(values) < self.elements:
+            rng    = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(0, step)))
+            draw   = sampler.stream(rng)
+            budget = -(-(self.elements - len(values)) // max(rounds - step, 1))
+            count  = budget if step == 0 else candidates * budget
+            with self._timer("sample"):
+                points = draw(1 << (count - 1).bit_length())[0:count]
+                if self.cache is not None:
+                    points = np.round(points, 6)
+            if self.feasibility is not None:
+                with self._timer("screen"):
+                    keep = self.feasibility.screen(sampler.unscale(points), self._exploration_rng(1, step))
+                self._count("screened", np.count_nonzero(~keep))
+                points = points[keep]
+            if len(points) > budget:
+                with self._timer("sample"):
+                    points = points[refiner.select(sampler.unscale(points), budget, rng)]
+            (results, valid) = self._evaluate_points(points, workers)
+            values           = np.concatenate([ values, np.hstack([ points, results ])[valid] ])
+            refiner.fit(sampler.unscale(values[:, 0:3]), values[:, outputs])
+            step += 1
+        if len(self.data.index) == 0:
+            self.data = self._build_frame(values[0:self.elements])
+        else:
+            self.data = pd.concat([ self.data, self._build_frame(values[0:self.elements]) ], ignore_index=True)
+        return self.data
+
+    ## Evaluates CEA at explicit operating points, e.g. to obtain truth values for validating a trained model. 
+    #  Points are first rounded to 6 significant digits, which collapses duplicates and near-duplicates into one 
+    #  solve each; the distinct points are then sorted, so that points sharing a (pressure, mixture) pair are solved
+    #  together, several area ratios per CEA run (see self._evaluate_chunk()), and split into chunks of 
+    #  self.chunk_size points which may be spread over a process pool.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #  @param workers   An optional parameter giving the number of worker processes to use
+    #
+    #  @returns         A tuple of a DataFrame of n rows, in the order of 'points' and with the same columns and 
+    #                   dtypes as self.data (the input columns hold the points as given; the output columns of 
+    #                   invalid points are NaN), and a Boolean array marking the points with a valid CEA result
+    def evaluate(self, points, workers=1):
+        points = np.asarray(points, dtype=np.float64)
+        if (points.ndim != 2) or (points.shape[1] != 3):
+            raise ValueError(f"points must be an (n, 3) array of (pressure, mixture, area_ratio) operating points, "
+                             f"got shape {points.shape}")
+        rounded           = np.array([ float(f"{value:g}") for value in points.ravel() ]).reshape(points.shape)
+        (unique, inverse) = np.unique(rounded, axis=0, return_inverse=True)
+        inverse           = inverse.reshape(-1)
+        (results, valid)  = self._evaluate_points(unique, workers)
+        return (self._build_frame(np.hstack([ points, results[inverse] ])), valid[inverse])
+
+    ## Wraps a block of numeric rows into a DataFrame with the full column schema. Numeric columns are float64; the 
+    #  constant 'fuel' and 'oxidizer' columns are stored as single-category categoricals.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param values    A 2-D float64 array whose columns are ordered as self.numeric_columns
+    #
+    #  @returns         A DataFrame with columns ordered as self.columns
+    def _build_frame(self, values):
+        with self._timer("frame"):
+            codes = np.zeros(len(values), dtype=np.int8)
+            frame = pd.DataFrame(values, columns=self.numeric_columns, copy=False)
+            frame.insert(0, "fuel",     pd.Categorical.from_codes(codes, categories=[ self.fuel ]))
+            frame.insert(1, "oxidizer", pd.Categorical.from_codes(codes, categories=[ self.oxidizer ]))
+        return frame
+
+    ## Returns a context manager timing its body under one of the self.stats phases, or a no-op context manager if
+    #  instrumentation is off.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param phase     The name of the phase, from CeaGeneratorStats.phases
+    #
+    #  @returns         A context manager
+    def _timer(self, phase):
+        return _NO_TIMER if self.stats is None else self.stats.timer(phase)
+
+    ## Increments one of the self.stats counters, if instrumentation is on.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param counter   The name of the counter, from CeaGeneratorStats.counters
+    #  @param amount    An optional parameter giving the amount to add
+    #
+    #  @returns         None
+    def _count(self, counter, amount=1):
+        if self.stats is not None:
+            self.stats.count(counter, amount)
+
+    ## Divides the sample budget from row 'start' onwards into chunks of at most self.chunk_size rows. Chunk indexes
+    #  are absolute (i.e. counted from the first row of the dataset) so that every chunk always maps onto the same 
+    #  random stream. When 'start' falls inside a chunk, the rows of that chunk before 'start' are marked to be 
+    #  skipped, since they must be regenerated to advance the chunk's random stream.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param start     The first row of the dataset to plan for
+    #
+    #  @returns         A list of (chunk index, rows to skip, rows to keep) tuples
+    def _chunk_plan(self, start):
+        plan  = []
+        while start < self.elements:
+            index = start // self.chunk_size
+            skip  = start - index * self.chunk_size
+            size  = min((index + 1) * self.chunk_size, self.elements) - start
+            plan.append((index, skip, size))
+            start += size
+        return plan
+
+    ## Computes the chunks of a plan from self._chunk_plan() either in-process (workers=1) or across a process pool,
+    #  yielding the value arrays of each chunk in chunk order.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param plan      A list of (chunk index, rows to skip, rows to keep) tuples
+    #  @param workers   The number of worker processes to use
+    #
+    #  @returns         A generator of 2-D float64 arrays, one per chunk
+    def _iter_chunks(self, plan, workers=1):
+        for (chunk, chunk_observed, chunk_stats) in self._run_chunks(plan, workers):
+            if chunk_stats is not None:
+                self.stats.merge(chunk_stats)
+            yield chunk
+
+    ## Runs the chunks of a plan in-process or across a process pool. Without a feasibility map, all chunks are 
+    #  independent. With one, the chunks are run in waves of self.feasibility_wave consecutive chunk indexes, 
+    #  aligned on absolute chunk indexes: every chunk of a wave is screened against (a copy of) self.feasibility as
+    #  it stood when the wave started, and the observations of the wave are merged into self.feasibility in chunk 
+    #  order once all of its chunks are done, before the next wave starts. Each chunk is therefore screened against 
+    #  everything learned from the waves before it, and the dataset still depends only on the seed, sample size and
+    #  starting map, not on the number of worker processes (which can only be kept busy up to the wave size). 
+    #  Observations of chunks already returned are also merged if the run is abandoned part way through a wave.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param plan      A list of (chunk index, rows to skip, rows to keep) tuples
+    #  @param workers   The number of worker processes to use
+    #
+    #  @returns         A generator of the (values, feasibility observations, stats) results of 
+    #                   self._call_task("_sample_chunk", ...), in chunk order
+    def _run_chunks(self, plan, workers=1):
+        if self.feasibility is None:
+            yield from self._map_tasks("_sample_chunk", plan, workers)
+            return
+        waves = self._chunk_waves(plan)
+        with self._task_runner(workers, max([ len(wave) for wave in waves ], default=0)) as run:
+            for wave in waves:
+                observed = []
+                try:
+                    for result in run("_sample_chunk", [ chunk + (self.feasibility,) for chunk in wave ]):
+                        observed.append(result[1])
+                        yield result
+                finally:
+                    for chunk_observed in observed:
+                        self.feasibility.merge(chunk_observed)
+
+    ## Splits a plan into the waves of chunks run by self._run_chunks(): runs of chunks sharing the same absolute 
+    #  chunk index divided by self.feasibility_wave, or the whole plan at once if no feasibility map is in use.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param plan      A list of (chunk index, rows to skip, rows to keep) tuples
+    #
+    #  @returns         A list of lists of (chunk index, rows to skip, rows to keep) tuples
+    def _chunk_waves(self, plan):
+        if self.feasibility is None:
+            return [ plan ] if len(plan) > 0 else []
+        return [ list(wave) for (_, wave) in itertools.groupby(plan, lambda chunk: chunk[0] // self.feasibility_wave) ]
+
+    ## Calls one of this generator's methods on each of a list of argument tuples, either in-process (workers=1) or
+    #  across a process pool whose workers each hold a private copy of the generator (see _init_worker()).
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param method    The name of the method to call
+    #  @param tasks     A list of argument tuples, one per call
+    #  @param workers   The number of worker processes to use
+    #
+    #  @returns         A generator of the results of self._call_task() for each task, in task order
+    def _map_tasks(self, method, tasks, workers=1):
+        with self._task_runner(workers, len(tasks)) as run:
+            yield from run(method, tasks)
+
+    ## Returns a context manager providing a function that calls one of this generator's methods on each of a list 
+    #  of argument tuples, like self._map_tasks(), and may be used repeatedly. Calls are made in-process if 
+    #  workers=1 or 'count' is at most 1; otherwise one process pool of at most 'count' workers, each holding a 
+    #  private copy of the generator (see _init_worker()), serves every call made inside the context.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param workers   The number of worker processes to use
+    #  @param count     The largest number of tasks that will be run at once
+    #
+    #  @returns         A context manager yielding a function of (method, tasks) which returns a generator of the 
+    #                   results of self._call_task() for each task, in task order
+    @contextlib.contextmanager
+    def _task_runner(self, workers, count):
+        if (workers is None) or (workers <= 1) or (count <= 1):
+            yield lambda method, tasks: (self._call_task(method, task) for task in tasks)
+        else:
+            with tempfile.TemporaryDirectory(prefix="rocketcea-") as data_dir, \
+                 mp.Pool(processes=min(workers, count), initializer=_init_worker, 
+                         initargs=(self, data_dir)) as pool:
+                yield lambda method, tasks: pool.imap(_run_worker_task, [ (method, task) for task in tasks ])
+
+    ## Calls a method returning a tuple and appends to it the instrumentation recorded during the call. While the
+    #  method runs, self.stats is swapped for a fresh CeaGeneratorStats object, so that the same accounting applies 
+    #  whether the call runs in-process or in a worker process (whose copy of self.stats is never sent back); the
+    #  caller merges the returned stats into self.stats.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param method    The name of the method to call
+    #  @param arguments The tuple of arguments to call it with
+    #
+    #  @returns         The tuple returned by the method, extended with a CeaGeneratorStats object (None if 
+    #                   instrumentation is off)
+    def _call_task(self, method, arguments):
+        stats      = self.stats
+        self.stats = None if stats is None else CeaGeneratorStats()
+        try:
+            return getattr(self, method)(*arguments) + (self.stats,)
+        finally:
+            self.stats = stats
+
+    ## Builds the random number generator for a given chunk. The stream is keyed on the generator seed and the
+    #  absolute chunk index only, so it is identical no matter which process computes the chunk.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param index     The absolute index of the chunk
+    #
+    #  @returns         A numpy.random.Generator seeded for the chunk
+    def _chunk_rng(self, index):
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(index,)))
+
+    ## Builds the random number generator used to pick exploration candidates when screening against the 
+    #  feasibility map. It is kept apart from the streams that draw operating points (spawn keys (index,) for 
+    #  chunks and (0, round) for adaptive rounds), so the points drawn never depend on how often the map screens.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param key       The integers identifying the stream: (0, chunk index) for chunks, (1, round) for adaptive 
+    #                   rounds
+    #
+    #  @returns         A numpy.random.Generator seeded for the stream
+    def _exploration_rng(self, *key):
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(1,) + key))
+
+    ## Draws operating points from the configured sampler and evaluates them with CEA until a chunk of 'skip' + 
+    #  'size' valid rows has been collected, then returns all but the first 'skip' rows. Points are drawn as whole
+    #  vectorized blocks, sized to the number of rows still needed (rounded up to a power of two, which keeps the
+    #  balance properties of Sobol' sequences). With self.eps_per_solve above 1, consecutive points of a block are
+    #  grouped and share the (pressure, mixture) of the first point in the group, keeping their own area ratios, so
+    #  each group is one CEA run. If a feasibility map is given, each block is screened against a private copy of 
+    #  it, which is updated with the outcome of every solve; exploration candidates are picked with a stream of 
+    #  their own (see self._exploration_rng()).
+    #
+    #  @param self        The reference to the calling CeaDatasetGenerator object
+    #  @param index       The absolute index of the chunk, used to seed its random stream
+    #  @param skip        The number of leading rows of the chunk to discard
+    #  @param size        The number of valid rows to return
+    #  @param feasibility An optional CeaFeasibilityMap to screen candidates against (see self._run_chunks()); it 
+    #                     is passed with the chunk, since the copy of self.feasibility held by a worker process is
+    #                     not kept up to date
+    #
+    #  @returns           A tuple of a 2-D float64 array of 'size' rows, with columns ordered as 
+    #                     self.numeric_columns, and a CeaFeasibilityMap of the chunk's feasibility observations 
+    #                     (None if no map is given)
+    def _sample_chunk(self, index, skip, size, feasibility=None):
+        base        = feasibility
+        rng         = self._chunk_rng(index)
+        explore     = self._exploration_rng(0, index)
+        sampler     = self._make_sampler()
+        draw        = sampler.stream(rng)
+        feasibility = None if base is None else base.copy()
+        group       = self.eps_per_solve
+        total       = skip + size
+        values      = np.empty((total, len(self.numeric_columns)), dtype=np.float64)
+        row         = 0
+        while row < total:
+            with self._timer("sample"):
+                points = draw(1 << (max(total - row, group) - 1).bit_length())
+                if group > 1:
+                    points          = points[0:((len(points) // group) * group)]
+                    points[:, 0:2]  = np.repeat(points[0::group, 0:2], group, axis=0)
+                    points[:, 2]    = [ float(f"{area_ratio:g}") for area_ratio in points[:, 2] ]
+                if self.cache is not None:
+                    points = np.round(points, 6)
+            keep = np.ones(len(points), dtype=bool)
+            if feasibility is not None:
+                with self._timer("screen"):
+                    unit = sampler.unscale(points)
+                    keep = feasibility.screen(unit, explore)
+                self._count("screened", np.count_nonzero(~keep))
+            for first in range(0, len(points), group):
+                members = np.flatnonzero(keep[first:(first + group)]) + first
+                if len(members) == 0:
+                    continue
+                (pressure, mixture) = points[first, 0:2]
+                area_ratios         = points[members, 2]
+                start               = time.perf_counter()
+                (results, valid)    = self.solve_operating_point(pressure, mixture, area_ratios)
+                if feasibility is not None:
+                    elapsed = (time.perf_counter() - start) / len(members)
+                    for (member, member_valid) in zip(members, valid):
+                        feasibility.observe(unit[member], member_valid, elapsed)
+                for member in np.flatnonzero(valid):
+                    values[row, 0:3] = (pressure, mixture, area_ratios[member])
+                    values[row, 3:]  = results[member]
+                    row += 1
+                    if row == total:
+                        break
+                if row == total:
+                    break
+        if self.cache is not None:
+            with self._timer("cache"):
+                self.cache.flush()
+        self._count("rows", size)
+        observed = None if feasibility is None else feasibility.difference(base)
+        return (values[skip:], observed)
+
+    ## Evaluates a list of operating points with CEA, in chunks of self.chunk_size points which may be spread over
+    #  a process pool. Feasibility observations are merged into self.feasibility once all chunks are done.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #  @param workers   An optional parameter giving the number of worker processes to use
+    #
+    #  @returns         A tuple of an (n, 27) float64 array of output values, ordered as the self.data columns 
+    #                   from 'pressure_throat' through 'mach_exit', and a Boolean array marking the valid points
+    def _evaluate_points(self, points, workers=1):
+        tasks    = [ (points[start:(start + self.chunk_size)],) for start in range(0, len(points), self.chunk_size) ]
+        results  = np.full((len(points), len(self.numeric_columns) - 3), np.nan)
+        valid    = np.zeros(len(points), dtype=bool)
+        observed = None
+        start    = 0
+        for result in self._map_tasks("_evaluate_chunk", tasks, workers):
+            (chunk_results, chunk_valid, chunk_observed, chunk_stats) = result
+            if chunk_stats is not None:
+                self.stats.merge(chunk_stats)
+            results[start:(start + len(chunk_valid))] = chunk_results
+            valid[start:(start + len(chunk_valid))]   = chunk_valid
+            start                                    += len(chunk_valid)
+            if chunk_observed is not None:
+                if observed is None:
+                    observed = chunk_observed
+                else:
+                    observed.merge(chunk_observed)
+        if observed is not None:
+            self.feasibility.merge(observed)
+        return (results, valid)
+
+    ## Evaluates one chunk of operating points for self._evaluate_points(). Consecutive points sharing a pressure and
+    #  mixture ratio are solved together, up to self.max_eps_per_solve area ratios per CEA run, provided their area
+    #  ratios survive the 6 significant digit formatting RocketCEA applies to a list of area ratios (so every point 
+    #  is solved exactly as given); other points get one CEA run each.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #
+    #  @returns         A tuple of an (n, 27) float64 array of output values, a Boolean array marking the valid 
+    #                   points and a CeaFeasibilityMap of the chunk's feasibility observations (None if no map is 
+    #                   in use)
+    def _evaluate_chunk(self, points):
+        sampler     = self._make_sampler()
+        feasibility = None if self.feasibility is None else self.feasibility.copy()
+        results     = np.full((len(points), len(self.numeric_columns) - 3), np.nan)
+        valid       = np.zeros(len(points), dtype=bool)
+        batchable   = np.array([ float(f"{area_ratio:g}") == area_ratio for area_ratio in points[:, 2] ], dtype=bool)
+        first       = 0
+        while first < len(points):
+            last = first + 1
+            while ((last < len(points)) and ((last - first) < self.max_eps_per_solve) and batchable[first] and 
+                   batchable[last] and np.array_equal(points[last, 0:2], points[first, 0:2])):
+                last += 1
+            start               = time.perf_counter()
+            (output, success)   = self.solve_operating_point(points[first, 0], points[first, 1], points[first:last, 2])
+            results[first:last] = output
+            valid[first:last]   = success
+            if feasibility is not None:
+                elapsed = (time.perf_counter() - start) / (last - first)
+                for (point, point_valid) in zip(sampler.unscale(points[first:last]), success):
+                    feasibility.observe(point, point_valid, elapsed)
+            first = last
+        if self.cache is not None:
+            with self._timer("cache"):
+                self.cache.flush()
+        self._count("rows", np.count_nonzero(valid))
+        observed = None if feasibility is None else feasibility.difference(self.feasibility)
+        return (results, valid, observed)
+
+    ## Builds the CeaSampler for the current input domain and sampling settings.
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #
+    #  @returns         A CeaSampler over self.p_range, self.phi_range and self.eps_range
+    def _make_sampler(self):
+        return CeaSampler([ self.p_range, self.phi_range, self.eps_range ], self.sampler, self.log_axes)
+
+    ## Evaluates one (pressure, mixture) operating point at one or more area ratios, with a single CEA run (or
+    #  cache lookup).
+    #
+    #  @param self        The reference to the calling CeaDatasetGenerator object
+    #  @param pressure    The chamber pressure (bar)
+    #  @param mixture     The propellant mixture ratio
+    #  @param area_ratios A sequence of up to 8 nozzle expansion area ratios
+    #
+    #  @returns           A tuple of a (len(area_ratios), 27) float64 array of output values, ordered as the 
+    #                     self.data columns from 'pressure_throat' through 'mach_exit', and a Boolean array marking
+    #                     which area ratios gave a valid CEA result
+    def solve_operating_point(self, pressure, mixture, area_ratios):
+        if len(area_ratios) == 1:
+            cea_fostr = self.run_cea(pressure, mixture, area_ratios[0])
+        else:
+            cea_fostr = self.run_cea(pressure, mixture, list(area_ratios))
+        with self._timer("parse"):
+            (results, valid) = self.parse_cea_exits(cea_fostr, area_ratios)
+        if self.stats is not None:
+            self.stats.count("attempted", len(valid))
+            self.stats.count("accepted",  np.count_nonzero(valid))
+            self.stats.count("rejected",  len(valid) - np.count_nonzero(valid))
+        return (results, valid)
+
+    ## Obtains the CEA full output string for an operating point, from self.cache if possible and otherwise by 
+    #  running CEA (storing the result in the cache, if one is in use). Several area ratios may be given, in which 
+    #  case CEA computes one exit station for each; the output is cached under every one of them.
+    #
+    #  @param self       The reference to the calling CeaDatasetGenerator object
+    #  @param pressure   The chamber pressure (bar)
+    #  @param mixture    The propellant mixture ratio
+    #  @param area_ratio The nozzle expansion area ratio, or a list of up to 8 of them
+    #
+    #  @returns          The CEA full output string (short output with transport properties, in SI units)
+    def run_cea(self, pressure, mixture, area_ratio):
+        area_ratios = np.atleast_1d(area_ratio)
+        if self.cache is not None:
+            with self._timer("cache"):
+                cached = { self.cache.get(self.fuel, self.oxidizer, pressure, mixture, eps) for eps in area_ratios }
+            if (len(cached) == 1) and (None not in cached):
+                self._count("cache_hits")
+                return cached.pop()
+        with self._timer("cea"):
+            cea_fostr = self.cea.get_full_cea_output(Pc=float(pressure), 
+                                                     MR=float(mixture), 
+                                                     eps=(float(area_ratio) if np.ndim(area_ratio) == 0 
+                                                          else [ float(eps) for eps in area_ratio ]), 
+                                                     short_output=1, 
+                                                     show_transport=1,
+                                                     output='siunits',
+                                                     pc_units='bar')
+        self._count("cea_calls")
+        if self.cache is not None:
+            with self._timer("cache"):
+                for eps in area_ratios:
+                    self.cache.put(self.fuel, self.oxidizer, pressure, mixture, eps, cea_fostr)
+        return cea_fostr
+
+    ## Drops the CEA backend and the accumulated data when a generator is sent to a worker process; the worker
+    #  builds its own CEA_Obj in _init_worker().
+    #
+    #  @param self      The reference to the calling CeaDatasetGenerator object
+    #
+    #  @returns         The picklable state dictionary
+    def __getstate__(self):
+        state         = self.__dict__.copy()
+        state["cea"]  = None
+        state["data"] = self.data.iloc[0:0]
+        return state
+
     ## Gets input domain from internal DataFrame. Primarily used in an older version of CeaDatasetGenerator;
     #  incorporated to avoid breaking old unit tests.
     #
@@ -143,13 +704,92 @@ class CeaDatasetGenerator:
     #
     #  @returns         A Boolean value indicating whether the result is valid or not
     def is_valid_cea_result(self, cea_fostr):
-        exit_regexp = re.search(r"EXIT", cea_fostr)
-        nan_regexp  = re.search(r"NaN",  cea_fostr)
+        exit_regexp = _EXIT_REGEXP.search(cea_fostr)
+        nan_regexp  = _NAN_REGEXP.search(cea_fostr)
         if (exit_regexp is not None) and (nan_regexp is None):
             return True
         else:
             return False
 
+    ## Extracts every output column of the dataset from a single CEA full output string (as produced with 
+    #  short_output=1, show_transport=1 and SI output units), in one scan over the string. Replaces the separate
+    #  get_Densities(), get_MachNumber() and get_*_Transport() CEA calls, each of which would otherwise re-solve the
+    #  same operating point. Heat capacities, conductivities and Prandtl numbers are taken from the 'WITH
+    #  EQUILIBRIUM REACTIONS' transport block. Densities are in kg/m^3, heat capacities in kJ/(kg K), viscosities in
+    #  millipoise and conductivities in mW/(cm K), as printed by CEA.
+    #
+    #  @param cea_fostr The CEA full output string corresponding to the test conditions
+    #
+    #  @returns         A tuple of the 27 output values, ordered as the self.data columns from 'pressure_throat' 
+    #                   through 'mach_exit'
+    @staticmethod
+    def parse_cea_output(cea_fostr):
+        rows        = _scan_cea_pages(cea_fostr)[0]
+        pressure    = rows["P, BAR"]
+        molar_mass  = rows["M, (1/n)"]
+        adiabat     = rows["GAMMAs"]
+        temperature = rows["T, K"]
+        rho         = rows["RHO, KG/CU M"]
+        spec_heat   = rows["Cp, KJ/(KG)(K)"]
+        visc        = rows["VISC,MILLIPOISE"]
+        cond        = rows["CONDUCTIVITY"]
+        prandtl     = rows["PRANDTL NUMBER"]
+        mach        = rows["MACH NUMBER"]
+        return ( pressure[1], pressure[2], molar_mass[0], molar_mass[1], molar_mass[2], adiabat[0], adiabat[1],
+                 adiabat[2], temperature[0], temperature[1], temperature[2], rho[0], rho[1], rho[2], spec_heat[0], 
+                 spec_heat[1], spec_heat[2], visc[0], visc[1], visc[2], cond[0], cond[1], cond[2], prandtl[0], 
+                 prandtl[1], prandtl[2], mach[2] )
+
+    ## Extracts the output columns for each of several exit stations from a CEA full output string computed for a 
+    #  list of area ratios. CEA prints at most six exit stations per page, repeating the chamber and throat columns
+    #  on each page; exit stations are matched to the requested area ratios through the printed 'Ae/At' row, so 
+    #  stations CEA failed to compute are reported invalid rather than misattributed. A station is valid if all 27 of
+    #  its values are finite; for single-station output the whole string must also pass is_valid_cea_result(), as
+    #  for parse_cea_output().
+    #
+    #  @param cea_fostr   The CEA full output string
+    #  @param area_ratios The sequence of area ratios the output was computed for (or a subset of them)
+    #
+    #  @returns           A tuple of a (len(area_ratios), 27) float64 array of output values, ordered as the 
+    #                     self.data columns from 'pressure_throat' through 'mach_exit' (NaN where invalid), and a
+    #                     Boolean array marking the valid stations
+    @staticmethod
+    def parse_cea_exits(cea_fostr, area_ratios):
+        values = np.full((len(area_ratios), 27), np.nan)
+        valid  = np.zeros(len(area_ratios), dtype=bool)
+        pages  = _scan_cea_pages(cea_fostr)
+        if (len(pages) == 0) or (_EXIT_REGEXP.search(cea_fostr) is None):
+            return (values, valid)
+        chamber = pages[0]
+        exits   = [ (page, column) for page in pages if "Ae/At" in page 
+                                   for column in range(2, len(page["Ae/At"])) ]
+        station = 0
+        for (point, area_ratio) in enumerate(area_ratios):
+            for candidate in range(station, len(exits)):
+                (page, column) = exits[candidate]
+                if abs(page["Ae/At"][column] - area_ratio) <= 1e-3 * area_ratio:
+                    station = candidate + 1
+                    try:
+                        values[point] = [ chamber["P, BAR"][1], page["P, BAR"][column], 
+                                          chamber["M, (1/n)"][0], chamber["M, (1/n)"][1], page["M, (1/n)"][column], 
+                                          chamber["GAMMAs"][0], chamber["GAMMAs"][1], page["GAMMAs"][column], 
+                                          chamber["T, K"][0], chamber["T, K"][1], page["T, K"][column], 
+                                          chamber["RHO, KG/CU M"][0], chamber["RHO, KG/CU M"][1], 
+                                          page["RHO, KG/CU M"][column], chamber["Cp, KJ/(KG)(K)"][0], 
+                                          chamber["Cp, KJ/(KG)(K)"][1], page["Cp, KJ/(KG)(K)"][column], 
+                                          chamber["VISC,MILLIPOISE"][0], chamber["VISC,MILLIPOISE"][1], 
+                                          page["VISC,MILLIPOISE"][column], chamber["CONDUCTIVITY"][0], 
+                                          chamber["CONDUCTIVITY"][1], page["CONDUCTIVITY"][column], 
+                                          chamber["PRANDTL NUMBER"][0], chamber["PRANDTL NUMBER"][1], 
+                                          page["PRANDTL NUMBER"][column], page["MACH NUMBER"][column] ]
+                    except (KeyError, IndexError):
+                        pass
+                    break
+        valid = np.all(np.isfinite(values), axis=1)
+        if len(exits) == 1:
+            valid &= _NAN_REGEXP.search(cea_fostr) is None
+        return (values, valid)
+
     ## Uses grouping regular expressions to extract the standard station pressures from the CEA full output.
     #
     #  @param self      The reference to the calling CeaDatasetGenerator object
@@ -157,7 +797,7 @@ class CeaDatasetGenerator:
     #
     #  @returns         A tuple consisting of the pressure at the engine throat and the pressure at nozzle exit
     def get_pressures(self, cea_fostr):
-        pressure_results = re.search(r"P, BAR\s*\d+.\d+\s*(\d+.\d+)\s*(\d+.\d+)", cea_fostr)
+        pressure_results = _PRESSURE_REGEXP.search(cea_fostr)
         pressure_throat  = float(pressure_results.group(1))
         pressure_exit    = float(pressure_results.group(2))
         return (pressure_throat, pressure_exit)
@@ -170,7 +810,7 @@ class CeaDatasetGenerator:
     #  @returns         A tuple consisting of the molar masses of the exhaust stream at the three standard engine 
     #                   stations
     def get_molar_masses(self, cea_fostr):
-        molar_mass_results = re.search(r"M, \(1/n\)\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)", cea_fostr)
+        molar_mass_results = _MOLAR_MASS_REGEXP.search(cea_fostr)
         molar_mass_chamber = float(molar_mass_results.group(1))
         molar_mass_throat  = float(molar_mass_results.group(2))
         molar_mass_exit    = float(molar_mass_results.group(3))
@@ -185,7 +825,7 @@ class CeaDatasetGenerator:
     #  @returns         A tuple consisting of the adiabatic indexes (ratios of specific heat) at the three standard
     #                   engine stations
     def get_adiabat(self, cea_fostr):
-        adiabat_results = re.search(r"GAMMAs\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)", cea_fostr)
+        adiabat_results = _ADIABAT_REGEXP.search(cea_fostr)
         adiabat_chamber = float(adiabat_results.group(1))
         adiabat_throat  = float(adiabat_results.group(2))
         adiabat_exit    = float(adiabat_results.group(3))
@@ -199,8 +839,103 @@ class CeaDatasetGenerator:
     #
     #  @returns         A tuple consisting of the temperatures at the three standard engine stations
     def get_temperatures(self, cea_fostr):
-        temperature_results = re.search(r"T, K\s*(\d+.\d+)\s*(\d+.\d+)\s*(\d+.\d+)", cea_fostr)
+        temperature_results = _TEMPERATURE_REGEXP.search(cea_fostr)
         temperature_chamber = float(temperature_results.group(1))
         temperature_throat  = float(temperature_results.group(2))
         temperature_exit    = float(temperature_results.group(3))
-        return (temperature_chamber, temperature_throat, temperature_exit)
\ No newline at end of file
+        return (temperature_chamber, temperature_throat, temperature_exit)
+
+## Scans a CEA full output string for the rows in _CEA_ROW_REGEXP, in one pass. Each page of output (CEA starts a
+#  new page after six exit stations) yields a dictionary mapping row labels to their list of station values. The 
+#  heat capacity row is taken from the 'WITH EQUILIBRIUM REACTIONS' transport block, and the frozen transport block
+#  is ignored (the 'Ae/At' row of the performance parameters, printed after it, is kept). The rows kept are only 
+#  converted once the scan is done, all together, by _parse_cea_fields().
+#
+#  @param cea_fostr The CEA full output string
+#
+#  @returns         A list of dictionaries, one per page of output
+def _scan_cea_pages(cea_fostr):
+    pages   = []
+    rows    = {}
+    section = None
+    for (label, text) in _CEA_ROW_REGEXP.findall(cea_fostr):
+        if label == "P, BAR":
+            rows    = {}
+            section = None
+            pages.append(rows)
+        if label == " WITH EQUILIBRIUM REACTIONS":
+            section = "equilibrium"
+        elif label == " WITH FROZEN REACTIONS":
+            section = "frozen"
+        elif (label == "Ae/At") or (section != "frozen") and ((label not in rows) or (section == "equilibrium")):
+            rows[label] = text
+    values = iter(_parse_cea_fields([ text for rows in pages for text in rows.values() ]))
+    for rows in pages:
+        for label in rows:
+            rows[label] = next(values)
+    return pages
+
+## Splits the value portions of CEA output rows into their 9-column station fields and converts each to a float. 
+#  The rows are padded to whole fields and joined, so that a single _CEA_FIELD_REGEXP.findall() call splits all of 
+#  them; only when a field is neither blank, a number nor in CEA's exponent notation (e.g. an overflow printed as 
+#  asterisks) are the fields converted one at a time instead.
+#
+#  @param texts     A list of the parts of output rows following their 16-column row labels
+#
+#  @returns         A list of lists of floats, one per row, holding one float per engine station (NaN where CEA 
+#                   printed NaN or nothing)
+def _parse_cea_fields(texts):
+    texts  = [ text.rstrip() for text in texts ]
+    fields = _CEA_FIELD_REGEXP.findall("".join(text + " " * (-len(text) % 9) for text in texts))
+    try:
+        values = [ float(mantissa) * 10.0 ** int(exponent) if mantissa else (float(plain) if plain else math.nan)
+                   for (mantissa, exponent, plain) in fields ]
+    except ValueError:
+        values = [ _parse_cea_field(*field) for field in fields ]
+    rows  = []
+    start = 0
+    for text in texts:
+        count  = -(-len(text) // 9)
+        rows.append(values[start:(start + count)])
+        start += count
+    return rows
+
+## Converts one station field split out by _CEA_FIELD_REGEXP, returning NaN for a field that cannot be converted.
+#
+#  @param mantissa  The mantissa of a field in CEA's exponent notation, or ''
+#  @param exponent  The exponent of a field in CEA's exponent notation, or ''
+#  @param plain     Any other non-blank field, or ''
+#
+#  @returns         The value of the field
+def _parse_cea_field(mantissa, exponent, plain):
+    try:
+        return float(mantissa) * 10.0 ** int(exponent) if mantissa else float(plain)
+    except ValueError:
+        return math.nan
+
+_NO_TIMER         = contextlib.nullcontext()
+_worker_generator = None
+
+## Process pool initializer. Installs a private copy of the calling generator in each worker process, complete with 
+#  its own CEA backend object. RocketCEA exchanges its input deck, scratch file and full output with the Fortran code 
+#  through files in a single data directory, so each worker is also pointed at its own directory to keep runs from 
+#  clobbering one another. 
+#
+#  @param generator The CeaDatasetGenerator whose settings the worker should use
+#  @param data_dir  A scratch directory under which the worker creates its private RocketCEA data directory
+#
+#  @returns         None
+def _init_worker(generator, data_dir):
+    global _worker_generator
+    cea_obj.ROCKETCEA_DATA_DIR = tempfile.mkdtemp(dir=data_dir)
+    generator.cea     = generator.backend(oxName=generator.oxidizer, fuelName=generator.fuel)
+    _worker_generator = generator
+
+## Process pool task. Calls one method of the worker's private generator.
+#
+#  @param task      A (method name, argument tuple) pair from CeaDatasetGenerator._map_tasks()
+#
+#  @returns         The result of CeaDatasetGenerator._call_task()
+def _run_worker_task(task):
+    (method, arguments) = task
+    return _worker_generator._call_task(method, arguments)
@@ -0,0 +1,197 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaDatasetGeneratorBenchmark.py                                                                  ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Benchmarks the CEA output parsers and the dataset generation pipeline offline, using             ║
+# ║              CeaReplayBackend in place of CEA so that the figures measure the Python overhead only: parser    ║
+# ║              throughput over the recorded CEA outputs, end-to-end rows/s of get_cea_data() against sample     ║
+# ║              size and worker count, and peak memory use. Results are saved to BenchmarkResults/<commit>.json  ║
+# ║              for comparison across commits.                                                                   ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy               as np
+import pandas              as pd
+from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaReplayBackend    import CeaReplayBackend
+
+## Times a function over repeated passes, returning the best pass (the least disturbed by other system activity).
+#
+#  @param function  The function to time, called without arguments
+#  @param repeat    The number of passes to time
+#
+#  @returns         The duration of the fastest pass, in seconds
+def best_time(function, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+## Measures the throughput of each CEA output parser over the recorded corpus. The per-property parsers are only 
+#  given the outputs that pass is_valid_cea_result(), as in production.
+#
+#  @param generator A CeaDatasetGenerator (with a replay backend) to call the parsers on
+#  @param passes    The number of passes over the corpus per timed repetition
+#  @param repeat    The number of timed repetitions
+#
+#  @returns         A dictionary mapping parser names to calls/s
+def benchmark_parsers(generator, passes, repeat):
+    corpus  = CeaReplayBackend().corpus
+    valid   = [ cea_fostr for cea_fostr in corpus if generator.is_valid_cea_result(cea_fostr) ]
+    parsers = { "is_valid_cea_result": (generator.is_valid_cea_result, corpus),
+                "get_pressures":       (generator.get_pressures,       valid),
+                "get_molar_masses":    (generator.get_molar_masses,    valid),
+                "get_adiabat":         (generator.get_adiabat,         valid),
+                "get_temperatures":    (generator.get_temperatures,    valid),
+                "parse_cea_output":    (generator.parse_cea_output,    valid) }
+    results = {}
+    for (name, (parser, inputs)) in parsers.items():
+        duration      = best_time(lambda: [ parser(cea_fostr) for _ in range(passes) for cea_fostr in inputs ], repeat)
+        results[name] = passes * len(inputs) / duration
+        print(f"{name:>20}: {results[name]:12,.0f} calls/s")
+    return results
+
+## Measures end-to-end get_cea_data() throughput for every combination of sample size, worker count and number of
+#  area ratios per CEA run (see CeaDatasetGenerator's 'eps_per_solve').
+#
+#  @param sizes     A list of sample sizes
+#  @param workers   A list of worker counts
+#  @param repeat    The number of timed repetitions per combination
+#  @param batches   An optional list of eps_per_solve settings
+#
+#  @returns         A list of { 'n', 'workers', 'eps_per_solve', 'rows_per_second' } dictionaries
+def benchmark_generation(sizes, workers, repeat, batches=(1,)):
+    results = []
+    for n in sizes:
+        for worker_count in workers:
+            for eps_per_solve in batches:
+                make     = lambda: CeaDatasetGenerator("CH4", "LOX", n=n, seed=0, eps_per_solve=eps_per_solve, 
+                                                       backend=CeaReplayBackend)
+                duration = best_time(lambda: make().get_cea_data(worker_count), repeat)
+                results.append({ "n": n, "workers": worker_count, "eps_per_solve": eps_per_solve, 
+                                 "rows_per_second": n / duration })
+                print(f"n={n:>7}, workers={worker_count:>2}, eps_per_solve={eps_per_solve}: "
+                      f"{n / duration:12,.0f} rows/s")
+    return results
+
+## Measures the peak memory allocated by the generating process (through tracemalloc, so worker processes are not 
+#  included) while generating datasets of each sample size in-process.
+#
+#  @param sizes     A list of sample sizes
+#
+#  @returns         A list of { 'n', 'peak_bytes', 'dataset_bytes' } dictionaries
+def benchmark_memory(sizes):
+    results = []
+    for n in sizes:
+        tracemalloc.start()
+        data = CeaDatasetGenerator("CH4", "LOX", n=n, seed=0, backend=CeaReplayBackend).get_cea_data()
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        dataset = int(data.memory_usage(deep=True).sum())
+        results.append({ "n": n, "peak_bytes": peak, "dataset_bytes": dataset })
+        print(f"n={n:>7}: peak {peak / 2**20:8.1f} MiB (dataset {dataset / 2**20:8.1f} MiB)")
+    return results
+
+## Identifies the commit being benchmarked, flagging uncommitted changes.
+#
+#  @returns         The short commit hash (with a '-dirty' suffix for a modified tree), or 'unknown'
+def current_commit():
+    try:
+        commit = subprocess.run([ "git", "rev-parse", "--short", "HEAD" ], capture_output=True, text=True, 
+                                check=True).stdout.strip()
+        dirty  = subprocess.run([ "git", "status", "--porcelain", "--untracked-files=no" ], capture_output=True, 
+                                text=True, check=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+## Prints the ratio of each throughput figure to the same figure in an earlier results file.
+#
+#  @param results   The results of this run
+#  @param path      The path of the earlier results file
+#
+#  @returns         None
+def compare(results, path):
+    with open(path) as f:
+        baseline = json.load(f)
+    print(f"Compared with {baseline['commit']} (ratio > 1 is faster):")
+    for (name, rate) in results["parsers"].items():
+        if name in baseline["parsers"]:
+            print(f"{name:>20}: {rate / baseline['parsers'][name]:6.2f}x")
+    setting  = lambda entry: (entry["n"], entry["workers"], entry.get("eps_per_solve", 1))
+    previous = { setting(entry): entry["rows_per_second"] for entry in baseline["generation"] }
+    for entry in results["generation"]:
+        if setting(entry) in previous:
+            print(f"n={entry['n']:>7}, workers={entry['workers']:>2}, eps_per_solve={setting(entry)[2]}: "
+                  f"{entry['rows_per_second'] / previous[setting(entry)]:6.2f}x")
+
+## Runs the benchmarks selected on the command line and saves the results. The pool workers of the generation 
+#  benchmark re-import this module where processes are spawned rather than forked, so it only runs under the 
+#  __main__ guard below.
+#
+#  @param argv      An optional list of command line arguments (default: sys.argv[1:])
+#
+#  @returns         The results dictionary
+def main(argv=None):
+    # Parse the command line. The default run takes a few minutes; --quick gives a rough reading in seconds.
+    parser = argparse.ArgumentParser(description="Offline benchmarks for CeaDatasetGenerator")
+    parser.add_argument("--quick",   action="store_true", help="use small sample sizes and few repetitions")
+    parser.add_argument("--output",  help="results file (default: BenchmarkResults/<commit>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+    if args.quick:
+        (passes, repeat, sizes, workers) = (20, 3, [ 1000, 5000 ], [ 1, 2 ])
+    else:
+        (passes, repeat, sizes, workers) = (200, 5, [ 1000, 10000, 100000 ], [ 1, 2, 4, os.cpu_count() ])
+    workers = sorted(set(workers))
+
+    # Run the benchmarks and save the results along with enough about the environment to interpret them.
+    commit  = current_commit()
+    print(f"Benchmarking {commit}")
+    results = { "commit":     commit,
+                "date":       time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python":     sys.version.split()[0],
+                "numpy":      np.__version__,
+                "pandas":     pd.__version__,
+                "platform":   platform.platform(),
+                "cpu_count":  os.cpu_count(),
+                "parsers":    benchmark_parsers(CeaDatasetGenerator("CH4", "LOX", backend=CeaReplayBackend), 
+                                                passes, repeat),
+                "generation": benchmark_generation(sizes, workers, repeat, batches=(1, 4)),
+                "memory":     benchmark_memory(sizes) }
+    output  = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), "BenchmarkResults", 
+                                          f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to {output}")
+    if args.compare:
+        compare(results, args.compare)
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ import matplotlib.cm       as cm
 import matplotlib.pyplot   as plt
 import numpy               as np
 import pandas              as pd
+import json
 import time
 from   scipy.stats         import norm
 from   CeaDatasetGenerator import CeaDatasetGenerator
@@ -42,14 +43,15 @@ plt.rcParams.update({
 
 # Generate the exemplary dataset using the CeaDatasetGenerator class. Use a large dataset to test the class under
 # production conditions. Print the dataset to the user and export it under TestingOutputs/. Benchmark the function
-# to see how long it takes under real conditions.
+# to see how long it takes under real conditions, and print the generator's breakdown of where that time went.
 elements = 50000
 start    = time.perf_counter()
-cea      = CeaDatasetGenerator("CH4", "LOX", n=elements)
+cea      = CeaDatasetGenerator("CH4", "LOX", n=elements, stats=True)
 df       = cea.get_cea_data()
 finish   = time.perf_counter()
 duration = finish - start
 print(f"Computed {elements} CEA elements in {duration} seconds ({float(elements) / duration} elements/s).")
+print(json.dumps(cea.stats.record(), indent=4))
 print(df)
 df.to_csv('TestingOutputs/CH4_LOX.csv', index=False)
 
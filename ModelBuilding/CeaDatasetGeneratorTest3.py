@@ -0,0 +1,63 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaDatasetGeneratorTest3.py                                                                      ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Offline test of the single-pass CEA output parser (CeaDatasetGenerator.parse_cea_output) against ║
+# ║              recorded CEA full output strings under TestingInputs/CeaOutputs/.                                ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import json
+import math
+import os
+from   CeaDatasetGenerator import CeaDatasetGenerator
+
+# Load the recorded CEA full output strings along with the reference values for the transport and density columns.
+# The references were captured from the equivalent RocketCEA accessor calls (get_Densities(), get_MachNumber() and
+# get_*_Transport()) when the fixtures were recorded, and converted to the SI units printed by CEA.
+fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TestingInputs", "CeaOutputs")
+with open(os.path.join(fixture_dir, "expected.json")) as f:
+    expected = json.load(f)
+
+# Parse each fixture. Invalid results must be flagged by is_valid_cea_result(); valid results must agree with the
+# older per-property regular expression parsers and with the recorded reference values to within CEA's printed 
+# precision.
+for (name, reference) in expected.items():
+    with open(os.path.join(fixture_dir, name)) as f:
+        cea_fostr = f.read()
+    valid = CeaDatasetGenerator.is_valid_cea_result(None, cea_fostr)
+    assert valid == (reference is not None), f"{name}: is_valid_cea_result() returned {valid}"
+    if not valid:
+        print(f"{name}: rejected as expected")
+        continue
+
+    values = CeaDatasetGenerator.parse_cea_output(cea_fostr)
+    assert len(values) == 27, f"{name}: expected 27 values, parsed {len(values)}"
+    checks = { "pressures":   (values[0:2],   CeaDatasetGenerator.get_pressures(None, cea_fostr)),
+               "molar_mass":  (values[2:5],   CeaDatasetGenerator.get_molar_masses(None, cea_fostr)),
+               "adiabat":     (values[5:8],   CeaDatasetGenerator.get_adiabat(None, cea_fostr)),
+               "temperature": (values[8:11],  CeaDatasetGenerator.get_temperatures(None, cea_fostr)),
+               "rho":         (values[11:14], reference["rho"]),
+               "spec_heat":   (values[14:17], reference["spec_heat"]),
+               "visc":        (values[17:20], reference["visc"]),
+               "cond":        (values[20:23], reference["cond"]),
+               "prandtl":     (values[23:26], reference["prandtl"]),
+               "mach_exit":   (values[26:27], [ reference["mach_exit"] ]) }
+    for (column, (parsed, wanted)) in checks.items():
+        for (a, b) in zip(parsed, wanted):
+            assert math.isclose(a, b, rel_tol=1e-3, abs_tol=1e-4), f"{name}: {column} parsed {a}, expected {b}"
+    print(f"{name}: all 27 columns match")
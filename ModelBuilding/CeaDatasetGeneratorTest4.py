@@ -0,0 +1,58 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaDatasetGeneratorTest4.py                                                                      ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Offline test that CeaDatasetGenerator datasets are independent of the worker count and that      ║
+# ║              iter_batches(start=k) reproduces get_cea_data().iloc[k:], using the CeaReplayBackend in place of ║
+# ║              CEA.                                                                                             ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import pandas              as pd
+from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaReplayBackend    import CeaReplayBackend
+
+# The replay backend picks its recorded output from the operating point alone, so any difference between the datasets
+# below comes from the generator's chunking, seeding or scheduling rather than from CEA. n is not a multiple of the 
+# chunk size, so the last chunk is a partial one.
+if __name__ == "__main__":
+    n    = 2 * CeaDatasetGenerator.chunk_size + 345
+    make = lambda: CeaDatasetGenerator("CH4", "LOX", n=n, seed=7, backend=CeaReplayBackend)
+    data = make().get_cea_data(workers=1)
+    assert len(data.index) == n, f"expected {n} rows, generated {len(data.index)}"
+
+    # The dataset must not depend on the number of worker processes.
+    for workers in [ 2, 4 ]:
+        pd.testing.assert_frame_equal(make().get_cea_data(workers=workers), data)
+        print(f"workers={workers}: identical to workers=1")
+
+    # Streaming from row 'start' must reproduce the tail of the full dataset, whatever the batch size and whether 
+    # 'start' falls on a chunk boundary or not.
+    for (start, batch_size, workers) in [ (0, 1000, 1), (1, 777, 1), (CeaDatasetGenerator.chunk_size, 500, 2), 
+                                          (1500, 4096, 4), (n - 1, 10, 1) ]:
+        tail = pd.concat(make().iter_batches(batch_size=batch_size, workers=workers, start=start), ignore_index=True)
+        pd.testing.assert_frame_equal(tail, data.iloc[start:].reset_index(drop=True))
+        print(f"iter_batches(start={start}, batch_size={batch_size}, workers={workers}): identical to the tail")
+
+    # The same holds when several area ratios are solved per CEA run, for which the replay backend prints one exit
+    # station per area ratio.
+    batched = CeaDatasetGenerator("CH4", "LOX", n=n, seed=7, eps_per_solve=4, backend=CeaReplayBackend)
+    data    = batched.get_cea_data(workers=1)
+    assert len(data.index) == n, f"eps_per_solve=4: expected {n} rows, generated {len(data.index)}"
+    pd.testing.assert_frame_equal(CeaDatasetGenerator("CH4", "LOX", n=n, seed=7, eps_per_solve=4, 
+                                                      backend=CeaReplayBackend).get_cea_data(workers=2), data)
+    print("eps_per_solve=4, workers=2: identical to workers=1")
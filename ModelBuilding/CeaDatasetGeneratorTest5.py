@@ -0,0 +1,42 @@
+
+import pandas              as pd
+from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaFeasibilityMap   import CeaFeasibilityMap
+
+# MMH/N2O4 fails to solve over a large part of its high mixture ratio, high area ratio corner, so a dataset drawn
+# from that corner spends a good share of its CEA solves on rejected points. The domain below is restricted to it so
+# that the check runs in a reasonable time.
+domain = { "phi_min": 10.0, "phi_max": 50.0, "eps_min": 20.0, "eps_max": 200.0 }
+
+## Builds an instrumented MMH/N2O4 generator over the restricted domain.
+#
+#  @param options   Additional CeaDatasetGenerator options
+#
+#  @returns         The CeaDatasetGenerator object
+def make(**options):
+    return CeaDatasetGenerator("MMH", "N2O4", n=4000, seed=3, stats=True, **domain, **options)
+
+if __name__ == "__main__":
+    plain = make()
+    data  = plain.get_cea_data()
+    base  = plain.stats.counts
+    print(f"no map: {base['attempted']} solves, {base['rejected']} rejected")
+
+    # A map whose threshold never rejects a cell must leave the dataset untouched, both in-process and across 
+    # workers screening waves of two chunks.
+    for (workers, wave) in [ (1, 1), (2, 2) ]:
+        silent = make(feasibility=CeaFeasibilityMap(threshold=0.0), feasibility_wave=wave)
+        pd.testing.assert_frame_equal(silent.get_cea_data(workers=workers), data)
+        assert silent.feasibility.screened == 0, "a silent map screened out candidates"
+        print(f"silent map (workers={workers}, feasibility_wave={wave}): identical to no map")
+
+    # An active map must learn the infeasible corner and skip candidates there, so that the same number of rows 
+    # takes fewer CEA solves and fewer of them are rejected.
+    screened = make(feasibility=True)
+    assert len(screened.get_cea_data().index) == len(data.index), "the screened dataset has the wrong size"
+    report   = screened.feasibility.report()
+    counts   = screened.stats.counts
+    print(f"map: {counts['attempted']} solves, {counts['rejected']} rejected, {report['screened']} screened out")
+    assert report["screened"] > 0, "the map did not screen out any candidates"
+    assert counts["attempted"] < base["attempted"], "the map did not reduce the number of CEA solves"
+    assert counts["rejected"]  < base["rejected"],  "the map did not reduce the number of rejected solves"
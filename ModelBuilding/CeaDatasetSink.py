@@ -0,0 +1,90 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaDatasetSink.py                                                                                ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements incremental on-disk storage of CeaDatasetGenerator output. Batches are appended to a  ║
+# ║              Parquet file (one row group per batch) or a CSV file as they are produced, so that datasets of   ║
+# ║              any size can be written without holding them in memory.                                          ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import os
+
+class CeaDatasetSink:
+    path = ""
+    format = ""
+    rows = 0
+
+    ## Constructor for a CeaDatasetSink object. Nothing is opened until the first batch arrives; the output format 
+    #  is taken from the file extension unless given explicitly. Parquet output requires the optional 'pyarrow' 
+    #  package, and the resulting file can be memory-mapped by readers (e.g. pyarrow.parquet.read_table(path, 
+    #  memory_map=True)) instead of being re-parsed.
+    #
+    #  @param self      The reference to the calling CeaDatasetSink object
+    #  @param path      The path of the output file. Any existing file at this path is overwritten.
+    #  @param format    An optional parameter selecting 'parquet' or 'csv' output. Inferred from 'path' if omitted.
+    #
+    #  @returns         None (constructor)
+    def __init__(self, path, format=None):
+        if format is None:
+            format = "parquet" if os.path.splitext(path)[1].lower() in (".parquet", ".pq") else "csv"
+        if format not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported dataset sink format '{format}' (expected 'parquet' or 'csv')")
+        self.path    = path
+        self.format  = format
+        self.rows    = 0
+        self._writer = None
+
+    ## Appends a batch of rows to the output file, creating the file (and, for CSV, writing the header) on the first
+    #  call. Each batch becomes one Parquet row group.
+    #
+    #  @param self      The reference to the calling CeaDatasetSink object
+    #  @param batch     A DataFrame batch, e.g. as yielded by CeaDatasetGenerator.iter_batches()
+    #
+    #  @returns         None
+    def write(self, batch):
+        if self.format == "parquet":
+            import pyarrow         as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(batch, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            if self._writer is None:
+                self._writer = open(self.path, "w", newline="")
+                batch.to_csv(self._writer, header=True, index=False)
+            else:
+                batch.to_csv(self._writer, header=False, index=False)
+            self._writer.flush()
+        self.rows += len(batch.index)
+
+    ## Finalizes the output file (writing the Parquet footer) and releases it.
+    #
+    #  @param self      The reference to the calling CeaDatasetSink object
+    #
+    #  @returns         None
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,216 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaFeasibilityMap.py                                                                             ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements a learned feasibility map over the CEA input domain. Tracks which regions of (chamber ║
+# ║              pressure, mixture ratio, area ratio) space CEA accepts or rejects, so that CeaDatasetGenerator   ║
+# ║              can skip candidates that are almost certain to be rejected instead of spending a full CEA solve  ║
+# ║              on them.                                                                                         ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import copy
+import numpy             as np
+
+class CeaFeasibilityMap:
+    bins = 16
+    threshold = 0.05
+    exploration = 0.05
+    min_observations = 8
+
+    ## Constructor for a CeaFeasibilityMap object: an occupancy grid over the unit cube of a CeaSampler (i.e. the
+    #  sampled (pressure, mixture, area_ratio) domain, in its linear or log scaling) counting how many CEA solves in
+    #  each cell were accepted or rejected by CeaDatasetGenerator.is_valid_cea_result(). Candidates falling in cells
+    #  that have been observed enough times and almost always fail are skipped before CEA is called, except for a 
+    #  small exploration fraction which keeps refining the feasibility boundary. A cell with fewer than 
+    #  'min_observations' solves is judged on the cell enclosing it in a grid of half the resolution, and so on up 
+    #  to the whole domain, so that screening starts long before every fine cell has been sampled enough.
+    #
+    #  @param self             The reference to the calling CeaFeasibilityMap object
+    #  @param bins             An optional parameter giving the number of grid cells along each axis
+    #  @param threshold        An optional parameter giving the estimated acceptance rate below which a cell is 
+    #                          screened out
+    #  @param exploration      An optional parameter giving the fraction of screened-out candidates evaluated anyway
+    #  @param min_observations An optional parameter giving the number of solves a cell needs before it is screened
+    #
+    #  @returns                None (constructor)
+    def __init__(self, bins=16, threshold=0.05, exploration=0.05, min_observations=8):
+        self.bins             = bins
+        self.threshold        = threshold
+        self.exploration      = exploration
+        self.min_observations = min_observations
+        self.accepted         = np.zeros((bins, bins, bins), dtype=np.int64)
+        self.rejected         = np.zeros((bins, bins, bins), dtype=np.int64)
+        self.screened         = 0
+        self.accepted_time    = 0.0
+        self.rejected_time    = 0.0
+
+    ## Decides which candidate points are worth a CEA solve. Each candidate is judged on the finest grid level at 
+    #  which its cell holds at least self.min_observations solves (see self._levels()); candidates with no such 
+    #  level are kept. Random numbers are only drawn for the candidates judged infeasible, one each, to pick the 
+    #  exploration fraction; 'rng' should therefore be a stream of its own rather than one used to draw candidates.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param unit      An (n, 3) array of candidate points in the sampler's unit cube
+    #  @param rng       The numpy.random.Generator used to pick exploration candidates
+    #
+    #  @returns         A Boolean array of length n, true for the candidates to evaluate
+    def screen(self, unit, rng):
+        cells   = np.column_stack(self._cells(unit))
+        keep    = np.ones(len(cells), dtype=bool)
+        decided = np.zeros(len(cells), dtype=bool)
+        for (level, (accepted, rejected)) in enumerate(self._levels()):
+            index        = tuple((cells >> level).T)
+            count        = accepted[index]
+            total        = count + rejected[index]
+            known        = ~decided & (total >= self.min_observations)
+            keep[known]  = count[known] >= self.threshold * total[known]
+            decided     |= known
+        infeasible       = np.flatnonzero(~keep)
+        keep[infeasible] = rng.random(len(infeasible)) < self.exploration
+        self.screened   += int(np.count_nonzero(~keep))
+        return keep
+
+    ## Records the outcome of one CEA solve.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param unit      The solved point in the sampler's unit cube
+    #  @param valid     Whether the CEA result was accepted
+    #  @param elapsed   The time taken by the solve, in seconds
+    #
+    #  @returns         None
+    def observe(self, unit, valid, elapsed):
+        cell = self._cells(np.reshape(unit, (1, 3)))
+        if valid:
+            self.accepted[cell] += 1
+            self.accepted_time  += elapsed
+        else:
+            self.rejected[cell] += 1
+            self.rejected_time  += elapsed
+
+    ## Returns a deep copy of the map.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #
+    #  @returns         A new CeaFeasibilityMap with the same settings and counts
+    def copy(self):
+        return copy.deepcopy(self)
+
+    ## Returns the observations recorded in this map since it was copied from 'base'.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param base      The CeaFeasibilityMap this map was copied from
+    #
+    #  @returns         A new CeaFeasibilityMap holding only the difference in counts
+    def difference(self, base):
+        delta               = self.copy()
+        delta.accepted     -= base.accepted
+        delta.rejected     -= base.rejected
+        delta.screened     -= base.screened
+        delta.accepted_time = self.accepted_time - base.accepted_time
+        delta.rejected_time = self.rejected_time - base.rejected_time
+        return delta
+
+    ## Adds the observations of another map (e.g. one returned by self.difference()) into this map.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param other     The CeaFeasibilityMap to merge
+    #
+    #  @returns         None
+    def merge(self, other):
+        self.accepted      += other.accepted
+        self.rejected      += other.rejected
+        self.screened      += other.screened
+        self.accepted_time += other.accepted_time
+        self.rejected_time += other.rejected_time
+
+    ## Summarizes how effective the map has been: the CEA rejection rate among solved points, the number of 
+    #  candidates skipped, and the CEA time those skips are estimated to have saved (each skipped candidate is 
+    #  charged the mean time of a rejected solve).
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #
+    #  @returns         A dictionary of feasibility statistics
+    def report(self):
+        accepted  = int(self.accepted.sum())
+        rejected  = int(self.rejected.sum())
+        solved    = accepted + rejected
+        mean_time = (self.rejected_time / rejected) if rejected > 0 else 0.0
+        return { "solved":         solved,
+                 "accepted":       accepted,
+                 "rejected":       rejected,
+                 "rejection_rate": (rejected / solved) if solved > 0 else 0.0,
+                 "screened":       self.screened,
+                 "cea_time":       self.accepted_time + self.rejected_time,
+                 "cea_time_saved": self.screened * mean_time }
+
+    ## Saves the map counts, effectiveness totals and settings to a NumPy .npz file.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param path      The path of the file to write
+    #
+    #  @returns         None
+    def save(self, path):
+        np.savez(path, accepted=self.accepted, rejected=self.rejected, 
+                 settings=np.array([ self.threshold, self.exploration, self.min_observations ]),
+                 totals=np.array([ self.screened, self.accepted_time, self.rejected_time ]))
+
+    ## Loads a map previously written by self.save().
+    #
+    #  @param path      The path of the file to read
+    #
+    #  @returns         A new CeaFeasibilityMap
+    @staticmethod
+    def load(path):
+        with np.load(path) as archive:
+            (threshold, exploration, min_observations) = archive["settings"]
+            feasibility = CeaFeasibilityMap(archive["accepted"].shape[0], threshold, exploration, 
+                                            int(min_observations))
+            feasibility.accepted[...] = archive["accepted"]
+            feasibility.rejected[...] = archive["rejected"]
+            if "totals" in archive:
+                (screened, feasibility.accepted_time, feasibility.rejected_time) = archive["totals"].tolist()
+                feasibility.screened = int(screened)
+        return feasibility
+
+    ## Builds the grid levels used by self.screen(): the accepted and rejected counts of this map's grid, then of 
+    #  successively coarser grids, each merging the cells of the previous one in pairs along every axis (cell i of 
+    #  a level holds cells 2i and 2i + 1 of the level below), down to a single cell.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #
+    #  @returns         A list of (accepted, rejected) pairs of 3-D count arrays, finest first
+    def _levels(self):
+        levels = [ (self.accepted, self.rejected) ]
+        while levels[-1][0].shape[0] > 1:
+            pooled = []
+            for counts in levels[-1]:
+                for axis in range(3):
+                    counts = np.add.reduceat(counts, np.arange(0, counts.shape[axis], 2), axis=axis)
+                pooled.append(counts)
+            levels.append(tuple(pooled))
+        return levels
+
+    ## Finds the grid cells holding a set of points.
+    #
+    #  @param self      The reference to the calling CeaFeasibilityMap object
+    #  @param unit      An (n, 3) array of points in the sampler's unit cube
+    #
+    #  @returns         A tuple of three index arrays, suitable for indexing self.accepted and self.rejected
+    def _cells(self, unit):
+        cells = np.clip((np.asarray(unit) * self.bins).astype(np.int64), 0, self.bins - 1)
+        return (cells[:, 0], cells[:, 1], cells[:, 2])
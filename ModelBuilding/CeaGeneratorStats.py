@@ -0,0 +1,146 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaGeneratorStats.py                                                                             ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements optional hot-path instrumentation for CeaDatasetGenerator: cumulative per-phase       ║
+# ║              timers (sampling, screening, cache lookups, CEA solves, output parsing and DataFrame             ║
+# ║              construction), sample counters and rolling throughput, exportable as a JSON stats record or      ║
+# ║              through a callback hook.                                                                         ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import collections
+import json
+import time
+
+class CeaGeneratorStats:
+    phases = [ "sample", "screen", "cache", "cea", "parse", "frame" ]
+    counters = [ "attempted", "accepted", "rejected", "screened", "cea_calls", "cache_hits", "rows" ]
+    window = 60.0
+
+    ## Constructor for a CeaGeneratorStats object, which accumulates where a CeaDatasetGenerator spends its time. 
+    #  Phase timers are cumulative seconds; those recorded in worker processes are summed across workers, so they
+    #  may exceed the elapsed time of a parallel run. The counters track operating points submitted to CEA 
+    #  ('attempted'), how many of those were 'accepted' or 'rejected', candidates 'screened' out by a feasibility
+    #  map, actual CEA runs ('cea_calls') versus 'cache_hits', and dataset 'rows' produced.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #  @param callback  An optional function called with the stats record (see self.record()) each time the 
+    #                   results of a chunk are merged in
+    #  @param window    An optional parameter giving the length, in seconds, of the rolling throughput window
+    #
+    #  @returns         None (constructor)
+    def __init__(self, callback=None, window=60.0):
+        self.callback = callback
+        self.window   = window
+        self.times    = dict.fromkeys(self.phases, 0.0)
+        self.counts   = dict.fromkeys(self.counters, 0)
+        self.start    = time.perf_counter()
+        self.history  = collections.deque([ (self.start, 0) ])
+
+    ## Returns a context manager adding the time spent in its body to a phase timer.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #  @param phase     The name of the phase, from self.phases
+    #
+    #  @returns         A context manager
+    def timer(self, phase):
+        return _PhaseTimer(self.times, phase)
+
+    ## Increments a counter.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #  @param counter   The name of the counter, from self.counters
+    #  @param amount    An optional parameter giving the amount to add
+    #
+    #  @returns         None
+    def count(self, counter, amount=1):
+        self.counts[counter] += int(amount)
+
+    ## Adds the timers and counters of another CeaGeneratorStats object (e.g. one recorded for a single chunk in a
+    #  worker process) into this one, updates the rolling throughput and calls the callback, if any.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #  @param other     The CeaGeneratorStats object to merge in
+    #
+    #  @returns         None
+    def merge(self, other):
+        for phase in self.phases:
+            self.times[phase] += other.times[phase]
+        for counter in self.counters:
+            self.counts[counter] += other.counts[counter]
+        now = time.perf_counter()
+        self.history.append((now, self.counts["rows"]))
+        while (len(self.history) > 2) and (self.history[1][0] < now - self.window):
+            self.history.popleft()
+        if self.callback is not None:
+            self.callback(self.record())
+
+    ## Builds the stats record: the counters and phase timers, together with the elapsed time since the object was 
+    #  created, the overall and rolling (over the last self.window seconds) throughput in rows/s, the acceptance 
+    #  rate of CEA solves and the number of CEA runs per row produced.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #
+    #  @returns         A JSON-serializable dictionary
+    def record(self):
+        elapsed                           = time.perf_counter() - self.start
+        (first, first_rows)               = self.history[0]
+        (last, last_rows)                 = self.history[-1]
+        record                            = dict(self.counts)
+        record["elapsed"]                 = elapsed
+        record["rows_per_second"]         = self.counts["rows"] / elapsed if elapsed > 0.0 else 0.0
+        record["rolling_rows_per_second"] = (last_rows - first_rows) / (last - first) if last > first else 0.0
+        record["acceptance_rate"]         = (self.counts["accepted"] / self.counts["attempted"] 
+                                             if self.counts["attempted"] > 0 else 0.0)
+        record["cea_calls_per_row"]       = (self.counts["cea_calls"] / self.counts["rows"] 
+                                             if self.counts["rows"] > 0 else 0.0)
+        record["phases"]                  = dict(self.times)
+        return record
+
+    ## Writes the stats record to a JSON file.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #  @param path      The path of the JSON file
+    #
+    #  @returns         None
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.record(), f, indent=4)
+
+    ## Drops the callback (which need not be picklable) when the object is sent to a worker process.
+    #
+    #  @param self      The reference to the calling CeaGeneratorStats object
+    #
+    #  @returns         The picklable state dictionary
+    def __getstate__(self):
+        state             = self.__dict__.copy()
+        state["callback"] = None
+        return state
+
+class _PhaseTimer:
+    __slots__ = [ "times", "phase", "start" ]
+
+    def __init__(self, times, phase):
+        self.times = times
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.times[self.phase] += time.perf_counter() - self.start
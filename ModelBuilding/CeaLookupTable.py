@@ -0,0 +1,171 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaLookupTable.py                                                                                ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements a gridded lookup table of CEA results for one propellant pair: a structured (chamber  ║
+# ║              pressure, mixture ratio, area ratio) grid, optionally log-spaced per axis, filled through        ║
+# ║              CeaDatasetGenerator and stored as a memory-mappable array, answering batched queries for all 27  ║
+# ║              output columns by vectorized multilinear or cubic interpolation.                                 ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import json
+import os
+import numpy               as np
+from   scipy.interpolate   import RegularGridInterpolator
+from   scipy.ndimage       import distance_transform_edt
+from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaSampler          import CeaSampler
+
+class CeaLookupTable:
+    methods = [ "linear", "cubic" ]
+    columns = CeaDatasetGenerator.numeric_columns[3:]
+
+    ## Constructor for a CeaLookupTable object. Tables are normally obtained from CeaLookupTable.build() or 
+    #  CeaLookupTable.load() rather than constructed directly. Interpolation runs in the table's own coordinates:
+    #  log-spaced axes are interpolated in log space, and output columns that are positive wherever CEA gave a
+    #  valid result are stored, and interpolated, as natural logarithms. Grid nodes where CEA gave no valid result
+    #  hold NaN, as do all queries depending on them.
+    #
+    #  @param self        The reference to the calling CeaLookupTable object
+    #  @param fuel        The fuel of the propellant pair
+    #  @param oxidizer    The oxidizer of the propellant pair
+    #  @param nodes       A list of three increasing arrays of grid nodes, one for each axis in CeaSampler.axes
+    #  @param values      A (pressure nodes, mixture nodes, area ratio nodes, 27) array of stored output values
+    #  @param log_axes    An optional list of axis names (from CeaSampler.axes) interpolated in log space
+    #  @param log_columns An optional list of column names (from self.columns) stored as natural logarithms
+    #
+    #  @returns           None (constructor)
+    def __init__(self, fuel, oxidizer, nodes, values, log_axes=(), log_columns=()):
+        self.fuel          = fuel
+        self.oxidizer      = oxidizer
+        self.nodes         = [ np.asarray(axis_nodes, dtype=np.float64) for axis_nodes in nodes ]
+        self.values        = values
+        self.log_axes      = list(log_axes)
+        self.log_columns   = list(log_columns)
+        self.log           = np.array([ axis in self.log_axes for axis in CeaSampler.axes ])
+        self.log_column    = np.array([ column in self.log_columns for column in self.columns ])
+        self.interpolators = {}
+
+    ## Builds a table by evaluating every node of a grid spanning the input domain of a generator (its pressure, 
+    #  mixture ratio and area ratio ranges) with CEA. Node coordinates are rounded to 6 significant digits, so that
+    #  each (pressure, mixture) row of area ratios can be solved in batches of CeaDatasetGenerator.max_eps_per_solve
+    #  exit stations per CEA run.
+    #
+    #  @param generator The CeaDatasetGenerator providing the propellant pair, input domain, CEA backend (and cache,
+    #                   if any) used to fill the grid
+    #  @param shape     An optional (pressure, mixture, area ratio) tuple giving the number of nodes along each axis
+    #  @param log_axes  An optional list of axis names (from CeaSampler.axes) to space logarithmically
+    #  @param workers   An optional parameter giving the number of worker processes to use
+    #  @param dtype     An optional parameter giving the floating point type of the stored values
+    #
+    #  @returns         A new CeaLookupTable
+    @staticmethod
+    def build(generator, shape=(33, 33, 17), log_axes=("pressure", "area_ratio"), workers=1, dtype=np.float32):
+        bounds = [ generator.p_range, generator.phi_range, generator.eps_range ]
+        nodes  = []
+        for (axis, (lower, upper), count) in zip(CeaSampler.axes, bounds, shape):
+            spacing = np.geomspace if axis in log_axes else np.linspace
+            nodes.append(np.array([ float(f"{node:g}") for node in spacing(lower, upper, count) ]))
+        points               = np.stack(np.meshgrid(*nodes, indexing="ij"), axis=-1).reshape(-1, 3)
+        (results, valid)     = generator._evaluate_points(points, workers)
+        results[~valid]      = np.nan
+        positive             = np.all(results[valid] > 0.0, axis=0) & np.any(valid)
+        results[:, positive] = np.log(results[:, positive])
+        values               = results.reshape(tuple(shape) + (len(CeaLookupTable.columns),)).astype(dtype)
+        log_columns          = [ column for (column, log) in zip(CeaLookupTable.columns, positive) if log ]
+        return CeaLookupTable(generator.fuel, generator.oxidizer, nodes, values, log_axes, log_columns)
+
+    ## Interpolates the table at a batch of operating points.
+    #
+    #  @param self      The reference to the calling CeaLookupTable object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #  @param method    An optional parameter selecting 'linear' (multilinear) or 'cubic' (tricubic spline) 
+    #                   interpolation. Cubic interpolation needs at least 4 nodes along each axis.
+    #
+    #  @returns         An (n, 27) float64 array of output values, with columns ordered as self.columns. Rows are NaN
+    #                   for points outside the grid or depending on grid nodes without a valid CEA result.
+    def query(self, points, method="linear"):
+        if method not in self.methods:
+            raise ValueError(f"Unknown interpolation method '{method}' (expected one of {self.methods})")
+        coordinates              = np.array(points, dtype=np.float64, ndmin=2)
+        coordinates[:, self.log] = np.log(coordinates[:, self.log])
+        values                   = np.asarray(self._interpolator(method)(coordinates), dtype=np.float64)
+        if method != "linear":
+            values[self._interpolator("invalid")(coordinates) > 0.0] = np.nan
+        values[:, self.log_column] = np.exp(values[:, self.log_column])
+        return values
+
+    ## Saves the table to a directory: the stored values as 'values.npy', which load() can memory-map, and the grid
+    #  description as 'table.json'.
+    #
+    #  @param self      The reference to the calling CeaLookupTable object
+    #  @param directory The directory to save to (created if needed)
+    #
+    #  @returns         None
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "values.npy"), self.values)
+        with open(os.path.join(directory, "table.json"), "w") as f:
+            json.dump({ "fuel":        self.fuel, 
+                        "oxidizer":    self.oxidizer,
+                        "axes":        CeaSampler.axes, 
+                        "nodes":       [ axis_nodes.tolist() for axis_nodes in self.nodes ], 
+                        "log_axes":    self.log_axes, 
+                        "columns":     self.columns,
+                        "log_columns": self.log_columns }, f, indent=4)
+
+    ## Loads a table saved by save().
+    #
+    #  @param directory The directory the table was saved to
+    #  @param mmap_mode An optional numpy.load() memory-map mode for the stored values ('r' by default, so that only
+    #                   the pages touched by queries are read; None loads the array into memory)
+    #
+    #  @returns         The loaded CeaLookupTable
+    @staticmethod
+    def load(directory, mmap_mode="r"):
+        with open(os.path.join(directory, "table.json")) as f:
+            table = json.load(f)
+        values = np.load(os.path.join(directory, "values.npy"), mmap_mode=mmap_mode)
+        return CeaLookupTable(table["fuel"], table["oxidizer"], table["nodes"], values, table["log_axes"], 
+                              table["log_columns"])
+
+    ## Returns the interpolator for a method, building it on first use. Besides self.methods, the 'invalid' 
+    #  interpolator gives the multilinear weight of grid nodes without a valid CEA result at each point; the cubic
+    #  interpolator is built over a copy of the values in which such nodes take the values of the nearest valid node
+    #  (as a spline fit cannot contain NaN), and the 'invalid' weight masks the affected points afterwards.
+    #
+    #  @param self      The reference to the calling CeaLookupTable object
+    #  @param method    'linear', 'cubic' or 'invalid'
+    #
+    #  @returns         A scipy.interpolate.RegularGridInterpolator
+    def _interpolator(self, method):
+        if method not in self.interpolators:
+            grid    = tuple(np.where(log, np.log(axis_nodes), axis_nodes) 
+                            for (log, axis_nodes) in zip(self.log, self.nodes))
+            invalid = np.isnan(self.values[..., 0])
+            kind    = "cubic" if method == "cubic" else "linear"
+            if method == "linear":
+                values = self.values
+            elif method == "invalid":
+                values = invalid.astype(np.float64)
+            else:
+                nearest = distance_transform_edt(invalid, return_distances=False, return_indices=True)
+                values  = np.asarray(self.values)[tuple(nearest)]
+            self.interpolators[method] = RegularGridInterpolator(grid, values, method=kind, bounds_error=False, 
+                                                                 fill_value=np.nan)
+        return self.interpolators[method]
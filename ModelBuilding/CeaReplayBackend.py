@@ -0,0 +1,96 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaReplayBackend.py                                                                              ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements a stand-in for RocketCEA's CEA_Obj that replays recorded CEA full output strings      ║
+# ║              instead of running the CEA Fortran code, so that CeaDatasetGenerator can be exercised and        ║
+# ║              benchmarked offline with the cost of CEA itself taken out.                                       ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import glob
+import os
+import re
+import zlib
+
+class CeaReplayBackend:
+    corpus_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TestingInputs", "CeaOutputs")
+
+    ## Constructor for a CeaReplayBackend object. Takes the same propellant arguments as CEA_Obj, so it can be given
+    #  to CeaDatasetGenerator as its 'backend', but ignores them: get_full_cea_output() replays one of the recorded
+    #  outputs in 'corpus_dir', whatever the propellants.
+    #
+    #  @param self       The reference to the calling CeaReplayBackend object
+    #  @param oxName     The oxidizer name (ignored)
+    #  @param fuelName   The fuel name (ignored)
+    #  @param corpus_dir An optional directory of recorded CEA full output strings ('*.txt' files)
+    #
+    #  @returns          None (constructor)
+    def __init__(self, oxName="", fuelName="", corpus_dir=None):
+        self.corpus = []
+        for path in sorted(glob.glob(os.path.join(corpus_dir or self.corpus_dir, "*.txt"))):
+            with open(path) as f:
+                self.corpus.append(f.read())
+        if len(self.corpus) == 0:
+            raise ValueError(f"No recorded CEA outputs (*.txt) found in {corpus_dir or self.corpus_dir}")
+
+    ## Returns a recorded output, picked by a checksum of the chamber pressure and mixture ratio so that an operating
+    #  point replays the same output in every process, which keeps replayed datasets independent of the worker count 
+    #  as they are with CEA. For a list of area ratios, the recorded exit column is repeated once per area ratio, 
+    #  six exits to a page as CEA prints them. The exit columns of the 'Ae/At' rows are then rewritten to the 
+    #  requested area ratios, since CeaDatasetGenerator.parse_cea_exits() matches exit stations to area ratios 
+    #  through those rows; the other rows are replayed as recorded.
+    #
+    #  @param self      The reference to the calling CeaReplayBackend object
+    #  @param eps       The nozzle expansion area ratio, or a list of them
+    #  @param options   The remaining get_full_cea_output() arguments (ignored)
+    #
+    #  @returns         A CEA full output string
+    def get_full_cea_output(self, eps=40.0, **options):
+        point     = f"{options.get('Pc')!r},{options.get('MR')!r}".encode()
+        cea_fostr = self.corpus[zlib.crc32(point) % len(self.corpus)]
+        if isinstance(eps, (list, tuple)):
+            return _repeat_exits(cea_fostr, [ float(area_ratio) for area_ratio in eps ])
+        return _AREA_RATIO_REGEXP.sub(lambda match: f"{match.group(1)}{eps:9.4f}", cea_fostr, count=1)
+
+## Rewrites a recorded CEA full output string with one exit station into the output for several area ratios: the 
+#  station table (from the 'CHAMBER THROAT EXIT' header to the mole fractions) is printed once per page of up to six
+#  exits, with the recorded exit column of each station row (a row of three 9-column fields) repeated once per exit 
+#  of the page and the 'Ae/At' row set to their area ratios. An output without an exit column (a failed solve) is 
+#  returned unchanged.
+#
+#  @param cea_fostr   The recorded CEA full output string
+#  @param area_ratios A list of nozzle expansion area ratios
+#
+#  @returns           A CEA full output string
+def _repeat_exits(cea_fostr, area_ratios):
+    table = _STATION_TABLE_REGEXP.search(cea_fostr)
+    if (table is None) or (_AREA_RATIO_REGEXP.search(table.group(0)) is None):
+        return cea_fostr
+    lines = table.group(0).split("\n")
+    pages = []
+    for start in range(0, len(area_ratios), 6):
+        exits = area_ratios[start:(start + 6)]
+        page  = [ line.ljust(43) + line.ljust(43)[34:] * (len(exits) - 1) if 34 < len(line) <= 43 else line 
+                  for line in (line.rstrip() for line in lines) ]
+        pages.append(_AREA_RATIO_REGEXP.sub(lambda match: match.group(1) + "".join(f"{area_ratio:9.4f}" 
+                                                                                   for area_ratio in exits), 
+                                            "\n".join(page), count=1))
+    return cea_fostr[:table.start()] + "\n".join(pages) + cea_fostr[table.end():]
+
+_AREA_RATIO_REGEXP    = re.compile(r"^( Ae/At {10}.{9}.{9}).{9}.*$", re.MULTILINE)
+_STATION_TABLE_REGEXP = re.compile(r"^ {17}CHAMBER   THROAT.*?(?=^  \* |^ NOTE)", re.MULTILINE | re.DOTALL)
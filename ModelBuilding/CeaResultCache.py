@@ -0,0 +1,209 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaResultCache.py                                                                                ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements a persistent, size-bounded on-disk cache of CEA full output strings keyed by          ║
+# ║              propellant pair and operating point, so that repeated and overlapping dataset generation runs do ║
+# ║              not pay for CEA solves already performed.                                                        ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import os
+import sqlite3
+import time
+import zlib
+
+class CeaResultCache:
+    path = ""
+    max_entries = None
+    resolution = 1e-6
+
+    ## Constructor for a CeaResultCache object. The cache is an SQLite database mapping (fuel, oxidizer, chamber 
+    #  pressure, mixture ratio, area ratio) to the compressed CEA full output string for that operating point, 
+    #  whether or not CeaDatasetGenerator.is_valid_cea_result() accepts it. Operating points are quantized to 
+    #  self.resolution, which matches the six decimal places RocketCEA writes into the CEA input deck, so a cached
+    #  output is exactly what CEA would return for the point. The database connection is opened lazily in each 
+    #  process that uses the cache, so a cache may be shared by CeaDatasetGenerator worker processes.
+    #
+    #  @param self        The reference to the calling CeaResultCache object
+    #  @param path        The path of the SQLite database file (created if it does not exist)
+    #  @param max_entries An optional parameter bounding the number of cached results. When exceeded, the least
+    #                     recently used tenth of the entries is evicted.
+    #
+    #  @returns           None (constructor)
+    def __init__(self, path, max_entries=None):
+        self.path        = path
+        self.max_entries = max_entries
+        self._connection = None
+        self._pid        = None
+        self._pending    = 0
+        self._hits       = 0
+        self._misses     = 0
+
+    ## Looks up the CEA output for an operating point.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #  @param fuel      The fuel name, as passed to CEA
+    #  @param oxidizer  The oxidizer name, as passed to CEA
+    #  @param pressure  The chamber pressure (bar)
+    #  @param mixture   The propellant mixture ratio
+    #  @param eps       The nozzle expansion area ratio
+    #
+    #  @returns         The cached CEA full output string, or None on a cache miss
+    def get(self, fuel, oxidizer, pressure, mixture, eps):
+        key = self._key(fuel, oxidizer, pressure, mixture, eps)
+        row = self._connect().execute("SELECT output FROM cea_results WHERE fuel = ? AND oxidizer = ? AND "
+                                      "pressure = ? AND mixture = ? AND eps = ?", key).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._connect().execute("UPDATE cea_results SET last_used = ? WHERE fuel = ? AND oxidizer = ? AND "
+                                "pressure = ? AND mixture = ? AND eps = ?", (time.time(),) + key)
+        self._mark_pending()
+        return zlib.decompress(row[0]).decode()
+
+    ## Stores the CEA output for an operating point, evicting old entries if the cache has grown past 
+    #  self.max_entries.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #  @param fuel      The fuel name, as passed to CEA
+    #  @param oxidizer  The oxidizer name, as passed to CEA
+    #  @param pressure  The chamber pressure (bar)
+    #  @param mixture   The propellant mixture ratio
+    #  @param eps       The nozzle expansion area ratio
+    #  @param cea_fostr The CEA full output string for the operating point
+    #
+    #  @returns         None
+    def put(self, fuel, oxidizer, pressure, mixture, eps, cea_fostr):
+        key = self._key(fuel, oxidizer, pressure, mixture, eps)
+        self._connect().execute("INSERT OR REPLACE INTO cea_results VALUES (?, ?, ?, ?, ?, ?, ?)", 
+                                key + (zlib.compress(cea_fostr.encode()), time.time()))
+        self._mark_pending()
+
+    ## Commits outstanding writes and adds this process's hit and miss counts to the totals stored in the database.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         None
+    def flush(self):
+        if self._connection is None:
+            return
+        connection = self._connect()
+        connection.execute("UPDATE cache_stats SET hits = hits + ?, misses = misses + ?", (self._hits, self._misses))
+        if self.max_entries is not None:
+            entries = connection.execute("SELECT COUNT(*) FROM cea_results").fetchone()[0]
+            if entries > self.max_entries:
+                evict = entries - self.max_entries + max(1, self.max_entries // 10)
+                connection.execute("DELETE FROM cea_results WHERE rowid IN (SELECT rowid FROM cea_results ORDER BY "
+                                   "last_used LIMIT ?)", (evict,))
+                connection.execute("UPDATE cache_stats SET evictions = evictions + ?", (evict,))
+        connection.commit()
+        self._pending = 0
+        self._hits    = 0
+        self._misses  = 0
+
+    ## Reports cache statistics accumulated over the lifetime of the database, across all processes that have 
+    #  flushed their counts.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         A dictionary with the number of entries, hits, misses, evictions and the hit rate
+    def stats(self):
+        self.flush()
+        connection = self._connect()
+        entries    = connection.execute("SELECT COUNT(*) FROM cea_results").fetchone()[0]
+        (hits, misses, evictions) = connection.execute("SELECT hits, misses, evictions FROM cache_stats").fetchone()
+        return { "entries":   entries,
+                 "hits":      hits,
+                 "misses":    misses,
+                 "evictions": evictions,
+                 "hit_rate":  (hits / (hits + misses)) if (hits + misses) > 0 else 0.0 }
+
+    ## Commits outstanding writes and closes this process's database connection.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         None
+    def close(self):
+        if (self._connection is not None) and (self._pid == os.getpid()):
+            self.flush()
+            self._connection.close()
+        self._connection = None
+
+    ## Drops the database connection when the cache is sent to another process; it is reopened there on first use.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         The picklable state dictionary
+    def __getstate__(self):
+        state                = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pending"]    = 0
+        state["_hits"]       = 0
+        state["_misses"]     = 0
+        return state
+
+    ## Builds the database key for an operating point, quantizing each value to self.resolution.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #  @param fuel      The fuel name, as passed to CEA
+    #  @param oxidizer  The oxidizer name, as passed to CEA
+    #  @param pressure  The chamber pressure (bar)
+    #  @param mixture   The propellant mixture ratio
+    #  @param eps       The nozzle expansion area ratio
+    #
+    #  @returns         A (fuel, oxidizer, pressure, mixture, eps) tuple with integer operating point values
+    def _key(self, fuel, oxidizer, pressure, mixture, eps):
+        return (fuel, oxidizer, int(round(pressure / self.resolution)), int(round(mixture / self.resolution)), 
+                int(round(eps / self.resolution)))
+
+    ## Counts an uncommitted write, committing every 100 writes so that other processes see new results promptly.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         None
+    def _mark_pending(self):
+        self._pending += 1
+        if self._pending >= 100:
+            self.flush()
+
+    ## Returns this process's database connection, opening it (and creating the schema) if necessary. A connection 
+    #  inherited from a parent process is never reused.
+    #
+    #  @param self      The reference to the calling CeaResultCache object
+    #
+    #  @returns         An sqlite3.Connection to self.path
+    def _connect(self):
+        if (self._connection is None) or (self._pid != os.getpid()):
+            self._connection = sqlite3.connect(self.path, timeout=60.0)
+            self._pid        = os.getpid()
+            self._pending    = 0
+            self._hits       = 0
+            self._misses     = 0
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cea_results (fuel TEXT, oxidizer TEXT, "
+                                     "pressure INTEGER, mixture INTEGER, eps INTEGER, output BLOB, last_used REAL, "
+                                     "PRIMARY KEY (fuel, oxidizer, pressure, mixture, eps))")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cea_results_last_used ON cea_results (last_used)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cache_stats (hits INTEGER, misses INTEGER, "
+                                     "evictions INTEGER)")
+            self._connection.execute("INSERT INTO cache_stats SELECT 0, 0, 0 WHERE NOT EXISTS "
+                                     "(SELECT 1 FROM cache_stats)")
+            self._connection.commit()
+        return self._connection
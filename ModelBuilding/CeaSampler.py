@@ -0,0 +1,97 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaSampler.py                                                                                    ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements vectorized design-of-experiments sampling of the CEA input domain (chamber pressure,  ║
+# ║              mixture ratio and area ratio) for CeaDatasetGenerator: plain Monte Carlo, scrambled Sobol' and   ║
+# ║              Halton low-discrepancy sequences and Latin hypercube sampling, each with optional per-axis log   ║
+# ║              scaling.                                                                                         ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import numpy             as np
+from   scipy.stats       import qmc
+
+class CeaSampler:
+    methods = [ "uniform", "sobol", "halton", "lhs" ]
+    axes = [ "pressure", "mixture", "area_ratio" ]
+
+    ## Constructor for a CeaSampler object, which draws blocks of (pressure, mixture, area_ratio) operating points 
+    #  over a rectangular input domain. Points are first drawn in the unit cube by one of the design-of-experiments 
+    #  methods in self.methods and then mapped onto the domain, linearly or logarithmically per axis.
+    #
+    #  @param self      The reference to the calling CeaSampler object
+    #  @param bounds    A list of [ lower, upper ] limits, one for each entry of self.axes
+    #  @param method    An optional parameter selecting plain Monte Carlo ('uniform'), scrambled Sobol' ('sobol') or
+    #                   Halton ('halton') low-discrepancy sequences, or Latin hypercube sampling ('lhs')
+    #  @param log_axes  An optional list of axis names (from self.axes) to sample uniformly in log space
+    #
+    #  @returns         None (constructor)
+    def __init__(self, bounds, method="uniform", log_axes=()):
+        if method not in self.methods:
+            raise ValueError(f"Unknown sampling method '{method}' (expected one of {self.methods})")
+        for axis in log_axes:
+            if axis not in self.axes:
+                raise ValueError(f"Unknown sampling axis '{axis}' (expected one of {self.axes})")
+        self.method = method
+        self.log    = np.array([ axis in log_axes for axis in self.axes ])
+        bounds      = np.asarray(bounds, dtype=np.float64)
+        if np.any(bounds[self.log] <= 0.0):
+            raise ValueError("Log-scaled sampling axes require strictly positive bounds")
+        self.lower  = np.where(self.log, np.log(bounds[:, 0]), bounds[:, 0])
+        self.upper  = np.where(self.log, np.log(bounds[:, 1]), bounds[:, 1])
+
+    ## Starts a new stream of points driven by 'rng'. Successive calls to the returned function continue the same 
+    #  sequence (for 'sobol' and 'halton'); for 'lhs' each call returns an independent Latin hypercube design.
+    #
+    #  @param self      The reference to the calling CeaSampler object
+    #  @param rng       The numpy.random.Generator used to draw (or scramble) the points
+    #
+    #  @returns         A function taking a point count and returning a (count, 3) array of operating points
+    def stream(self, rng):
+        dims = len(self.axes)
+        if self.method == "sobol":
+            unit = qmc.Sobol(dims, scramble=True, seed=rng).random
+        elif self.method == "halton":
+            unit = qmc.Halton(dims, scramble=True, seed=rng).random
+        elif self.method == "lhs":
+            unit = qmc.LatinHypercube(dims, seed=rng).random
+        else:
+            unit = lambda count: rng.random((count, dims))
+        return lambda count: self.scale(unit(count))
+
+    ## Maps points from the unit cube onto the input domain.
+    #
+    #  @param self      The reference to the calling CeaSampler object
+    #  @param unit      An (n, 3) array of points in the unit cube
+    #
+    #  @returns         An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    def scale(self, unit):
+        points              = self.lower + unit * (self.upper - self.lower)
+        points[:, self.log] = np.exp(points[:, self.log])
+        return points
+
+    ## Maps operating points back into the unit cube; the inverse of self.scale().
+    #
+    #  @param self      The reference to the calling CeaSampler object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #
+    #  @returns         An (n, 3) array of points in the unit cube
+    def unscale(self, points):
+        points              = np.array(points, dtype=np.float64)
+        points[:, self.log] = np.log(points[:, self.log])
+        return (points - self.lower) / (self.upper - self.lower)
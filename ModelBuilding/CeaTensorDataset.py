@@ -0,0 +1,244 @@
+# ╔═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╗
+# ║ File:        CeaTensorDataset.py                                                                              ║
+# ║ Namespace:   N/A                                                                                              ║
+# ║ Project:     Ariadne/ModelBuilding                                                                            ║
+# ║ Author:      Elijah Creed Fedele                                                                              ║
+# ║ Date:        October 18, 2026                                                                                 ║
+# ║ Description: Implements export of generated CEA datasets to fixed-layout binary training tensors (float32 or  ║
+# ║              float16 input and target arrays, as .npy files or raw memory maps) with a JSON sidecar of per-   ║
+# ║              column log transforms and normalization parameters, and zero-copy memory-mapped loading of the   ║
+# ║              exported tensors.                                                                                ║
+# ╠═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╣
+# ║ Copyright (C) 2023 Elijah Creed Fedele                                                                        ║
+# ║                                                                                                               ║
+# ║ This program is free software: you can redistribute it and/or modify it under the terms of the GNU General    ║
+# ║ Public License as published by the Free Software Foundation, either version 3 of the License, or (at your     ║
+# ║ option) any later version.                                                                                    ║
+# ║                                                                                                               ║
+# ║ This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the    ║
+# ║ implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License  ║
+# ║ for more details.                                                                                             ║
+# ║                                                                                                               ║
+# ║ You should have received a copy of the GNU General Public License along with this program.  If not, see       ║
+# ║ <http://www.gnu.org/licenses/>.                                                                               ║
+# ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
+
+import fnmatch
+import json
+import os
+import numpy               as np
+import pandas              as pd
+from   CeaDatasetGenerator import CeaDatasetGenerator
+
+class CeaTensorDataset:
+    input_columns = CeaDatasetGenerator.numeric_columns[0:3]
+    target_columns = CeaDatasetGenerator.numeric_columns[3:]
+    log_patterns = [ "pressure*", "rho_*", "visc_*" ]
+    formats = [ "npy", "raw" ]
+
+    ## Constructor for a CeaTensorDataset object, which holds exported training tensors. Obtained from 
+    #  CeaTensorDataset.export() or CeaTensorDataset.load() rather than constructed directly.
+    #
+    #  @param self      The reference to the calling CeaTensorDataset object
+    #  @param inputs    An (n, 3) array of normalized inputs, with columns ordered as self.input_columns
+    #  @param targets   An (n, 27) array of normalized targets, with columns ordered as self.target_columns
+    #  @param metadata  The sidecar dictionary describing the tensors (see CeaTensorDataset.export())
+    #
+    #  @returns         None (constructor)
+    def __init__(self, inputs, targets, metadata):
+        self.inputs   = inputs
+        self.targets  = targets
+        self.metadata = metadata
+
+    ## Exports a dataset to 'inputs' and 'targets' tensors in a directory. Each column is transformed (natural log 
+    #  for the columns matching 'log_patterns', identity otherwise) and then standardized to zero mean and unit 
+    #  variance, with the statistics computed in float64 over the whole dataset, before being cast to 'dtype'. The
+    #  transforms and statistics are saved with the tensor layout in 'tensors.json', so training code can use the 
+    #  tensors as they are, and map model inputs and outputs with encode_inputs() and decode_targets(). Rows with 
+    #  any non-finite value (e.g. the NaN rows evaluate() returns for invalid CEA results) are left out of both the 
+    #  statistics and the tensors; their number is saved as 'dropped_rows'.
+    #  
+    #  The source is read twice (once for the statistics, once to write the tensors) one DataFrame at a time, so 
+    #  campaign outputs can be exported without loading them whole. Note that float16 keeps about 3 significant 
+    #  digits of the normalized values, against CEA's 5.
+    #
+    #  @param source       A DataFrame with the self.data columns of CeaDatasetGenerator, or a list of such 
+    #                      DataFrames or of paths to Parquet or CSV files holding them (e.g. campaign part files)
+    #  @param directory    The directory to write to (created if needed)
+    #  @param dtype        An optional parameter selecting 'float32' or 'float16' tensors
+    #  @param format       An optional parameter selecting '.npy' files ('npy') or headerless C-order memory maps
+    #                      ('raw'), whose shape and dtype are given in the sidecar only
+    #  @param log_patterns An optional list of shell-style column name patterns to log-transform
+    #
+    #  @returns            The exported CeaTensorDataset, memory-mapped from 'directory'
+    @staticmethod
+    def export(source, directory, dtype="float32", format="npy", log_patterns=None):
+        if np.dtype(dtype) not in (np.float32, np.float16):
+            raise ValueError(f"Unsupported tensor dtype '{dtype}' (expected 'float32' or 'float16')")
+        if format not in CeaTensorDataset.formats:
+            raise ValueError(f"Unsupported tensor format '{format}' (expected one of {CeaTensorDataset.formats})")
+        columns  = CeaTensorDataset.input_columns + CeaTensorDataset.target_columns
+        patterns = CeaTensorDataset.log_patterns if log_patterns is None else log_patterns
+        log      = np.array([ any(fnmatch.fnmatch(column, pattern) for pattern in patterns) for column in columns ])
+        count    = 0
+        dropped  = 0
+        shift    = None
+        total    = np.zeros(len(columns))
+        squares  = np.zeros(len(columns))
+        for frame in _read_frames(source):
+            (values, invalid) = _finite_rows(frame[columns].to_numpy(dtype=np.float64))
+            values            = _transform(values, log, columns)
+            dropped          += invalid
+            if shift is None:
+                shift = values.mean(axis=0) if len(values) > 0 else np.zeros(len(columns))
+            count   += len(values)
+            total   += (values - shift).sum(axis=0)
+            squares += ((values - shift) ** 2).sum(axis=0)
+        if count == 0:
+            raise ValueError("Cannot export an empty dataset" + 
+                             (f" ({dropped} rows with non-finite values dropped)" if dropped > 0 else ""))
+        mean     = shift + total / count
+        std      = np.sqrt(np.maximum(squares / count - (total / count) ** 2, 0.0))
+        std      = np.where(std > 0.0, std, 1.0)
+        metadata = { "rows":           count,
+                     "dropped_rows":   dropped,
+                     "dtype":          np.dtype(dtype).name,
+                     "format":         format,
+                     "byteorder":      "little",
+                     "input_columns":  CeaTensorDataset.input_columns,
+                     "target_columns": CeaTensorDataset.target_columns,
+                     "transforms":     { column: ("log" if column_log else "identity") 
+                                         for (column, column_log) in zip(columns, log) },
+                     "mean":           dict(zip(columns, mean.tolist())),
+                     "std":            dict(zip(columns, std.tolist())) }
+        os.makedirs(directory, exist_ok=True)
+        inputs  = _open_tensor(directory, "inputs",  metadata, len(CeaTensorDataset.input_columns),  "w+")
+        targets = _open_tensor(directory, "targets", metadata, len(CeaTensorDataset.target_columns), "w+")
+        row     = 0
+        for frame in _read_frames(source):
+            values = _finite_rows(frame[columns].to_numpy(dtype=np.float64))[0]
+            values = (_transform(values, log, columns) - mean) / std
+            inputs[row:(row + len(values))]  = values[:, 0:3]
+            targets[row:(row + len(values))] = values[:, 3:]
+            row                             += len(values)
+        inputs.flush()
+        targets.flush()
+        del inputs, targets
+        with open(os.path.join(directory, "tensors.json"), "w") as f:
+            json.dump(metadata, f, indent=4)
+        return CeaTensorDataset.load(directory)
+
+    ## Loads tensors written by export().
+    #
+    #  @param directory The directory the tensors were exported to
+    #  @param mmap_mode An optional numpy memory-map mode ('r' by default, giving read-only zero-copy views of the
+    #                   files; None reads the tensors into memory)
+    #
+    #  @returns         The loaded CeaTensorDataset
+    @staticmethod
+    def load(directory, mmap_mode="r"):
+        with open(os.path.join(directory, "tensors.json")) as f:
+            metadata = json.load(f)
+        inputs  = _open_tensor(directory, "inputs",  metadata, len(metadata["input_columns"]),  mmap_mode)
+        targets = _open_tensor(directory, "targets", metadata, len(metadata["target_columns"]), mmap_mode)
+        return CeaTensorDataset(inputs, targets, metadata)
+
+    ## Applies the exported transforms and normalization to operating points, e.g. to query a model trained on the
+    #  tensors.
+    #
+    #  @param self      The reference to the calling CeaTensorDataset object
+    #  @param points    An (n, 3) array of (pressure, mixture, area_ratio) operating points
+    #
+    #  @returns         An (n, 3) array of normalized inputs, in the tensor dtype
+    def encode_inputs(self, points):
+        return self._encode(np.array(points, dtype=np.float64, ndmin=2), 
+                            self.metadata["input_columns"]).astype(self.metadata["dtype"])
+
+    ## Undoes the exported normalization and transforms, mapping normalized targets (e.g. model predictions) back to 
+    #  physical values.
+    #
+    #  @param self      The reference to the calling CeaTensorDataset object
+    #  @param values    An (n, 27) array of normalized targets
+    #
+    #  @returns         An (n, 27) float64 array of output values, with columns ordered as self.target_columns
+    def decode_targets(self, values):
+        columns        = self.metadata["target_columns"]
+        mean           = np.array([ self.metadata["mean"][column] for column in columns ])
+        std            = np.array([ self.metadata["std"][column] for column in columns ])
+        log            = np.array([ self.metadata["transforms"][column] == "log" for column in columns ])
+        values         = np.array(values, dtype=np.float64, ndmin=2) * std + mean
+        values[:, log] = np.exp(values[:, log])
+        return values
+
+    ## Applies the exported transforms and normalization to the given columns.
+    #
+    #  @param self      The reference to the calling CeaTensorDataset object
+    #  @param values    An (n, m) float64 array of physical values
+    #  @param columns   The names of the m columns
+    #
+    #  @returns         An (n, m) float64 array of normalized values
+    def _encode(self, values, columns):
+        mean = np.array([ self.metadata["mean"][column] for column in columns ])
+        std  = np.array([ self.metadata["std"][column] for column in columns ])
+        log  = np.array([ self.metadata["transforms"][column] == "log" for column in columns ])
+        return (_transform(values, log, columns) - mean) / std
+
+## Iterates over the DataFrames of an export source (see CeaTensorDataset.export()), reading files one at a time.
+#
+#  @param source    A DataFrame, or a list of DataFrames or Parquet/CSV file paths
+#
+#  @returns         A generator of DataFrames
+def _read_frames(source):
+    for item in ([ source ] if isinstance(source, pd.DataFrame) else source):
+        if not isinstance(item, str):
+            yield item
+        elif os.path.splitext(item)[1].lower() in (".parquet", ".pq"):
+            yield pd.read_parquet(item)
+        else:
+            yield pd.read_csv(item)
+
+## Removes the rows of a block of values holding any NaN or infinite value.
+#
+#  @param values    An (n, m) float64 array
+#
+#  @returns         A (finite rows, number of rows removed) tuple
+def _finite_rows(values):
+    finite = np.isfinite(values).all(axis=1)
+    return (values[finite], len(values) - int(finite.sum()))
+
+## Log-transforms the flagged columns of a block of values.
+#
+#  @param values    An (n, m) float64 array
+#  @param log       A Boolean array of length m flagging the columns to log-transform
+#  @param columns   The names of the m columns, for error messages
+#
+#  @returns         The transformed (n, m) float64 array
+def _transform(values, log, columns):
+    values = np.array(values, dtype=np.float64)
+    if np.any(values[:, log] <= 0.0):
+        raise ValueError(f"Log-transformed columns must be strictly positive: "
+                         f"{[ column for (column, column_log) in zip(columns, log) if column_log ]}")
+    values[:, log] = np.log(values[:, log])
+    return values
+
+## Opens one exported tensor file, as described by the sidecar metadata.
+#
+#  @param directory The export directory
+#  @param name      'inputs' or 'targets'
+#  @param metadata  The sidecar dictionary
+#  @param width     The number of columns of the tensor
+#  @param mode      A numpy memory-map mode ('w+' to create the file), or None to read it into memory
+#
+#  @returns         An (n, width) array or memory map
+def _open_tensor(directory, name, metadata, width, mode):
+    shape = (metadata["rows"], width)
+    dtype = np.dtype(metadata["dtype"]).newbyteorder("<")
+    if metadata["format"] == "npy":
+        path = os.path.join(directory, f"{name}.npy")
+        if mode == "w+":
+            return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        return np.load(path, mmap_mode=mode)
+    path = os.path.join(directory, f"{name}.bin")
+    if mode is None:
+        return np.fromfile(path, dtype=dtype).reshape(shape)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
@@ -1,7 +1,8 @@
 import numpy               as np
 import pandas              as pd
+import os
 import time
-from   CeaDatasetGenerator import CeaDatasetGenerator
+from   CeaCampaign         import CeaCampaign
 
 fuels = ["CH4", "RP-1", "MeOH", "EtOH", "LH2", "N2H4", "MMH", "UDMH", "Aerozine-50"]
 oxids = ["LOX", "N2O4", "HNO3", "RFNA", "H2O2"]
@@ -10,9 +11,14 @@ oxids = ["LOX", "N2O4", "HNO3", "RFNA", "H2O2"]
 #   - fuels: MeOH, EtOH, Aerozine-50
 #   - oxids: RFNA (83.5% HNO3, 14% NTO, 2.5% H2O)
 
-for fuel in fuels:
-    for oxidizer in oxids:
-        dataset_gen = CeaDatasetGenerator(fuel, oxidizer, n=100_000)
+# Generate every fuel/oxidizer pair into RawData/<fuel>_<oxidizer>/part-*.parquet. Progress is checkpointed to 
+# RawData/manifest.json, so re-running this script after an interruption resumes the campaign where it stopped. All
+# pairs share one pool of worker processes, which re-import this script where processes are spawned rather than 
+# forked (Windows, macOS), so the campaign must only run when the script is executed directly.
+if __name__ == "__main__":
+    campaign = CeaCampaign([ (fuel, oxidizer) for fuel in fuels for oxidizer in oxids ], "RawData", n=100_000)
+    campaign.run(workers=os.cpu_count())
 
-
-        output_filename = f"RawData/{fuel}_{oxidizer}.csv"
\ No newline at end of file
+    # Export each pair's dataset to normalized float32 training tensors under RawData/<fuel>_<oxidizer>/tensors/, 
+    # which training code can memory-map directly with CeaTensorDataset.load().
+    campaign.export_tensors()